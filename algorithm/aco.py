@@ -1,18 +1,17 @@
-import os
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from utils.method.generatepath import generate_paths
-from utils.method.visualization import visualize_network
+from utils.method.reporting import Reporter
+from utils.method.profiling import NullTimer
 from utils.method.pheromone_update import pheromone_update
 from utils.method.evaluate import evaluate, format_duration
+from utils.method.random_streams import spawn_rngs
 
 
-def ACO(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, max_iterations=100, tolerance=1e-5, patience=20, verbose=0, animate=0, learning_curve=0):
+def ACO(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, max_iterations=100, tolerance=1e-5, patience=20, verbose=0, animate=0, learning_curve=0, rng=None, animation_stride=1, reporter=None, profiler=None):
     """
     Runs the Ant Colony Optimization (ACO) algorithm to find the optimal job-worker assignments.
     
     :param jobs: List of jobs.
-    :param matches: List of Match objects (job-worker pairs with pheromone and processing duration).
+    :param matches: MatchTable of Match objects (job-worker pairs with pheromone and processing duration).
     :param ants: List of Ant objects, where each ant has a path.
     :param alpha: Pheromone influence factor.
     :param beta: Heuristic information influence factor.
@@ -21,46 +20,45 @@ def ACO(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, max_iterations
     :param max_iterations: Maximum number of iterations to run.
     :param tolerance: Threshold to stop the algorithm when the change in total duration is small enough.
     :param patience: Number of consecutive iterations without significant improvement before stopping.
+    :param rng: Seed or numpy Generator; every ant gets its own stream spawned from it.
+    :param animation_stride: Number of iterations between two frames of the animation.
+    :param reporter: Reporter receiving the makespan of every iteration (created from animate/learning_curve when None).
+    :param profiler: PhaseTimer (utils/method/profiling.py) timing the phases of every iteration.
     :return: A tuple containing the optimal path and the total processing duration.
     """
+    # Independent random stream for each ant
+    for ant, ant_rng in zip(ants, spawn_rngs(rng, len(ants))):
+        ant.rng = ant_rng
+
     best_global_path = []
     best_global_length = float('inf')
-    makespans = []
     previous_duration = float('inf')  # Start with an infinitely large duration
     iteration = 0
     no_improvement_count = 0  # Counter for iterations without significant improvement
-    if animate:
-        fig, ax = plt.subplots(figsize=(12, 8))
-        frames = []
-
-        # Directory to store frames temporarily
-        temp_dir = "./frames"
-        os.makedirs(temp_dir, exist_ok=True)
+    # Reporting (animation, learning curve) if requested
+    if reporter is None and (animate or learning_curve):
+        reporter = Reporter(animate, learning_curve, animation_stride)
+    if reporter:
+        reporter.start(jobs, workers, matches)
+    profiler = profiler if profiler is not None else NullTimer()
+    profiler.start()
 
     while iteration < max_iterations:
-        if animate:
-            # Clear axis to prevent overlap
-            ax.clear()
-        
         # Generate paths for ants based on current pheromone levels
-        ants = generate_paths(ants, jobs, matches, alpha, beta)
+        with profiler.phase("generate_paths"):
+            ants = generate_paths(ants, jobs, matches, alpha, beta)
 
         # Update pheromone levels based on the paths taken by the ants
-        matches = pheromone_update(ants, matches, evap_coeff, Q)
-
-        if animate:
-            # Capture frame
-            visualize_network(jobs, workers, matches, ax)
-            ax.set_title(f"Iteration {iteration}")
-    
-            # Save the current figure as an image file and store the filename
-            filename = os.path.join(temp_dir, f"frame_{iteration}.png")
-            plt.savefig(filename, dpi= 300)
-            frames.append(filename)
+        with profiler.phase("pheromone_update"):
+            matches = pheromone_update(ants, matches, evap_coeff, Q)
 
         # Evaluate the current best path and its total duration
-        current_path, current_length = evaluate(jobs, matches)
-        makespans.append(current_length)
+        with profiler.phase("evaluate"):
+            current_path, current_length = evaluate(jobs, matches)
+        if reporter:
+            with profiler.phase("report"):
+                reporter.record(iteration, current_length, matches)
+        profiler.iteration(iteration, len(ants) + 1)  # One makespan per ant, plus the pheromone-best path
 
         # 6) Update global best if improved
         if current_length < best_global_length:
@@ -85,29 +83,11 @@ def ACO(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, max_iterations
         previous_duration = current_length
         iteration += 1
 
-    if animate:
-        # Compile images into an animation
-        images = [plt.imread(frame) for frame in frames]
-        ani = animation.ArtistAnimation(fig, [[plt.imshow(img, animated=True)] for img in images], interval=500, blit=True)
-        ani.save("output/ACO_animation.gif", writer="pillow", fps=2)
-    
-        # Clean up temporary frame files
-        for frame in frames:
-            os.remove(frame)
-        os.rmdir(temp_dir)
-
-    plt.show()
+    profiler.stop()
 
-    if learning_curve:
-        # Plot the learning curve
-        plt.figure(figsize=(10, 6))
-        plt.plot(range(len(makespans)), makespans, marker='o')
-        plt.title("Learning Curve of ACO")
-        plt.xlabel("Iteration")
-        plt.ylabel("Makespan (Total Duration)")
-        plt.grid()
-        plt.savefig("output/learning_curve.png", dpi=300)
-        plt.show()
+    # Finalize the animation and write the learning curve in the background
+    if reporter:
+        reporter.finish()
     
     # Final output
     if verbose:
@@ -0,0 +1,152 @@
+import numpy as np
+
+from utils.method.data_treatment import create_matrices
+from utils.method.generatepath import generate_assignments
+from utils.method.reporting import Reporter
+from utils.method.profiling import NullTimer
+from utils.method.pheromone_update import pheromone_update_minmax_vectorized, init_min_max_pheromones, max_worker_processing_duration
+from utils.method.evaluate import evaluate_matrix, format_duration
+from utils.method.random_streams import make_rng
+
+def ACO_vectorized(jobs,
+        workers,
+        matches,
+        ants,
+        alpha,
+        beta,
+        evap_coeff,
+        Q,
+        max_iterations=100,
+        tolerance=1e-5,
+        patience=10,
+        verbose=0,
+        animate=0,
+        learning_curve=0,
+        rng=None,
+        animation_stride=1,
+        reporter=None,
+        profiler=None):
+    """
+    Runs the Elitist Min–Max Ant Colony Optimization (ACO) algorithm on dense NumPy arrays.
+
+    Pheromone levels and processing durations are held in jobs x workers arrays and the
+    assignments of all ants are sampled in one batched operation per iteration. The
+    parameters and the returned value are the same as for ACO_elitist_minmax; the final
+    pheromone levels are written back to the matches.
+
+    :param jobs: List of jobs.
+    :param workers: List of worker resources.
+    :param matches: MatchTable of Match objects (job-worker pairs with pheromone and processing duration).
+    :param ants: List of Ant objects, where each ant has a `path` attribute.
+    :param alpha: Pheromone influence factor.
+    :param beta: Heuristic information influence factor.
+    :param evap_coeff: Coefficient for pheromone evaporation (ρ).
+    :param Q: Constant for pheromone deposition.
+    :param max_iterations: Maximum number of iterations.
+    :param tolerance: Threshold for convergence (change in makespan).
+    :param patience: Number of iterations without improvement before stopping.
+    :param verbose: Verbosity flag.
+    :param animate: Flag to generate an animation of the search.
+    :param learning_curve: Flag to plot and save the learning curve.
+    :param rng: Seed or numpy Generator of the batched draws.
+    :param animation_stride: Number of iterations between two frames of the animation.
+    :param reporter: Reporter receiving the makespan of every iteration (created from animate/learning_curve when None).
+    :param profiler: PhaseTimer (utils/method/profiling.py) timing the phases of every iteration.
+    :return: Tuple (best_global_path, best_global_length).
+    """
+    pheromone, duration = create_matrices(jobs, workers, matches)
+    eta = 1 / duration  # Inverse of the distance is the proximity
+    feasible = np.isfinite(duration)  # Pairs without match (e.g. infeasible) have an infinite duration
+    rng = make_rng(rng)
+
+    # 1) Initial global best from current pheromones
+    best_global_path, best_global_length = evaluate_matrix(jobs, workers, pheromone)
+
+    # 2) Initialize Min–Max pheromone bounds
+    tau_min, tau_max = init_min_max_pheromones(evap_coeff,
+                                               best_global_length,
+                                               n_decisions=len(jobs))
+
+    previous_duration = float('inf')
+    no_improve_count = 0
+    iteration = 0
+
+    # Reporting (animation, learning curve) if requested
+    if reporter is None and (animate or learning_curve):
+        reporter = Reporter(animate, learning_curve, animation_stride)
+    if reporter:
+        reporter.start(jobs, workers, matches)
+    profiler = profiler if profiler is not None else NullTimer()
+    profiler.start()
+
+    # Main loop
+    while iteration < max_iterations:
+        # 3) Construct solutions for the whole colony at once
+        with profiler.phase("generate_assignments"):
+            assignments = generate_assignments(pheromone, eta, len(ants), alpha, beta, rng)
+        with profiler.phase("ant_makespans"):
+            lengths = []
+            for ant, assignment in zip(ants, assignments):
+                ant.path = [(job, workers[w]) for job, w in zip(jobs, assignment)]
+                lengths.append(max_worker_processing_duration(ant.path))
+
+        # 4) Pheromone update (Elitist Min–Max)
+        with profiler.phase("pheromone_update"):
+            pheromone = pheromone_update_minmax_vectorized(pheromone,
+                                                           assignments,
+                                                           lengths,
+                                                           evap_coeff,
+                                                           Q,
+                                                           tau_min,
+                                                           tau_max,
+                                                           feasible)
+
+        # 5) Evaluate current best from pheromones
+        with profiler.phase("evaluate"):
+            current_path, current_length = evaluate_matrix(jobs, workers, pheromone)
+        if reporter:
+            with profiler.phase("report"):
+                reporter.record(iteration, current_length, pheromone)
+        profiler.iteration(iteration, len(ants) + 1)  # One makespan per ant, plus the pheromone-best path
+
+        # 6) Update global best if improved
+        if current_length < best_global_length:
+            best_global_path, best_global_length = current_path, current_length
+            tau_min, tau_max = init_min_max_pheromones(evap_coeff,
+                                                       best_global_length,
+                                                       n_decisions=len(jobs))
+
+        # 7) Convergence check
+        diff = abs(previous_duration - current_length)
+        if diff < tolerance:
+            no_improve_count += 1
+        else:
+            no_improve_count = 0
+
+        if no_improve_count >= patience:
+            if verbose:
+                print(f"No improvement for {patience} iterations. Stopping at iter {iteration}.")
+            break
+
+        previous_duration = current_length
+        iteration += 1
+
+    profiler.stop()
+    _write_back(matches, pheromone)
+
+    # Finalize the animation and write the learning curve in the background
+    if reporter:
+        reporter.finish()
+
+    # Final output
+    if verbose:
+        print(f"Best makespan: {format_duration(best_global_length)}")
+    return best_global_path, best_global_length
+
+
+def _write_back(matches, pheromone):
+    """
+    Copies the pheromone array back onto the Match objects.
+    """
+    for (j, w), match in matches.cells.items():
+        match.pheromone = float(pheromone[j, w])
@@ -0,0 +1,167 @@
+import threading
+from collections import namedtuple
+from time import perf_counter
+
+from utils.method.generatepath import generate_paths
+from utils.method.pheromone_update import pheromone_update_minmax, init_min_max_pheromones
+from utils.method.evaluate import evaluate, format_duration
+from utils.method.random_streams import spawn_rngs
+from utils.method.profiling import NullTimer
+
+# Best assignment known at some point of an anytime run
+Snapshot = namedtuple('Snapshot', ['best_path', 'makespan', 'iteration', 'elapsed'])
+
+
+class CancellationToken:
+    """
+    Flag used to stop an anytime run from the outside (another thread, a signal handler, a callback).
+    """
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+def ACO_anytime(jobs,
+        workers,
+        matches,
+        ants,
+        alpha,
+        beta,
+        evap_coeff,
+        Q,
+        time_budget=None,
+        cancel=None,
+        max_iterations=None,
+        tolerance=1e-5,
+        patience=None,
+        rng=None,
+        profiler=None,
+        reporter=None,
+        verbose=0):
+    """
+    Anytime form of ACO_elitist_minmax: a generator yielding a Snapshot every time the best makespan improves.
+
+    The first snapshot (iteration -1) is the assignment given by the initial pheromone levels, so a
+    result is available right away. The run stops at the first of: the wall-clock budget is spent,
+    the cancellation token is set, max_iterations is reached, or (with patience) the makespan
+    stagnated. The budget is checked between iterations, so it can be exceeded by one iteration.
+    ACO_elitist_minmax runs this generator to the end and returns its last snapshot.
+
+    :param jobs: List of jobs.
+    :param workers: List of workers.
+    :param matches: MatchTable of Match objects (job-worker pairs with pheromone and processing duration).
+    :param ants: List of Ant objects.
+    :param alpha: Pheromone influence factor.
+    :param beta: Heuristic information influence factor.
+    :param evap_coeff: Coefficient for pheromone evaporation (ρ).
+    :param Q: Constant for pheromone deposition.
+    :param time_budget: Wall-clock budget in seconds, None for no limit.
+    :param cancel: CancellationToken stopping the run when set.
+    :param max_iterations: Maximum number of iterations, None for no limit.
+    :param tolerance: Threshold for convergence (change in makespan).
+    :param patience: Number of iterations without improvement before stopping, None to never stop on stagnation.
+    :param rng: Seed or numpy Generator; every ant gets its own stream spawned from it.
+    :param profiler: PhaseTimer (utils/method/profiling.py) timing the phases of every iteration.
+    :param reporter: Reporter receiving the makespan of every iteration, started and finished by the run.
+    :param verbose: Print why the run stopped on stagnation.
+    :return: Generator of Snapshot(best_path, makespan, iteration, elapsed).
+    """
+    started = perf_counter()
+    for ant, ant_rng in zip(ants, spawn_rngs(rng, len(ants))):
+        ant.rng = ant_rng
+
+    # Initial global best and Min–Max pheromone bounds from the current pheromones
+    best_global_path, best_global_length = evaluate(jobs, matches)
+    tau_min, tau_max = init_min_max_pheromones(evap_coeff,
+                                               best_global_length,
+                                               n_decisions=len(jobs))
+
+    if reporter:
+        reporter.start(jobs, workers, matches)
+    profiler = profiler if profiler is not None else NullTimer()
+    profiler.start()
+
+    try:
+        yield Snapshot(best_global_path, best_global_length, -1, perf_counter() - started)
+
+        previous_duration = float('inf')
+        no_improve_count = 0
+        iteration = 0
+        while max_iterations is None or iteration < max_iterations:
+            if cancel is not None and cancel.cancelled:
+                break
+            if time_budget is not None and perf_counter() - started >= time_budget:
+                break
+
+            # Construct solutions
+            with profiler.phase("generate_paths"):
+                ants = generate_paths(ants, jobs, matches, alpha, beta)
+
+            # Pheromone update (Elitist Min–Max)
+            with profiler.phase("pheromone_update"):
+                matches = pheromone_update_minmax(ants,
+                                                  matches,
+                                                  evap_coeff,
+                                                  Q,
+                                                  best_global_path,
+                                                  best_global_length,
+                                                  tau_min,
+                                                  tau_max)
+
+            # Evaluate current best from pheromones
+            with profiler.phase("evaluate"):
+                current_path, current_length = evaluate(jobs, matches)
+            if reporter:
+                with profiler.phase("report"):
+                    reporter.record(iteration, current_length, matches)
+            profiler.iteration(iteration, len(ants) + 1)  # One makespan per ant, plus the pheromone-best path
+
+            # Update global best if improved
+            if current_length < best_global_length:
+                best_global_path, best_global_length = current_path, current_length
+                tau_min, tau_max = init_min_max_pheromones(evap_coeff,
+                                                           best_global_length,
+                                                           n_decisions=len(jobs))
+                yield Snapshot(best_global_path, best_global_length, iteration, perf_counter() - started)
+
+            # Convergence check
+            if abs(previous_duration - current_length) < tolerance:
+                no_improve_count += 1
+            else:
+                no_improve_count = 0
+            if patience is not None and no_improve_count >= patience:
+                if verbose:
+                    print(f"No improvement for {patience} iterations. Stopping at iter {iteration}.")
+                break
+
+            previous_duration = current_length
+            iteration += 1
+    finally:
+        # Also reached when the consumer stops early (callback, or the generator is closed)
+        profiler.stop()
+        if reporter:
+            reporter.finish()  # Finalize the animation and write the learning curve in the background
+
+def run_anytime(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, time_budget=None, cancel=None, callback=None, verbose=0, **kwargs):
+    """
+    Runs ACO_anytime to the end and returns its best snapshot.
+
+    :param callback: Function called with every improving Snapshot; returning True cancels the run.
+    :param verbose: Print every improving snapshot and why the run stopped on stagnation.
+    :param kwargs: Other parameters of ACO_anytime (max_iterations, tolerance, patience, rng, profiler, reporter).
+    :return: The last (best) Snapshot.
+    """
+    best = None
+    for snapshot in ACO_anytime(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, time_budget, cancel, verbose=verbose, **kwargs):
+        best = snapshot
+        if verbose:
+            print(f"Iteration {snapshot.iteration} ({snapshot.elapsed:.3f} s): {format_duration(snapshot.makespan)}")
+        if callback is not None and callback(snapshot):
+            break
+    return best
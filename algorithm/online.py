@@ -0,0 +1,162 @@
+from algorithm.anytime import run_anytime
+from models.ant import Ant
+from utils.options import capacity_aware, transfer_aware
+from utils.method.data_treatment import create_matches
+from utils.method.pheromone_update import worker_duration_cache, configure_worker_duration
+from utils.method.random_streams import make_rng
+from utils.method.transfer_costs import TransferCosts
+from utils.method.warm_start import export_pheromones, seed_pheromones
+
+# Solver parameters of every epoch (see ACO_anytime); the solve of an epoch stops after
+# epoch_budget seconds, or after max_iterations when it is set
+EPOCH_PARAMS = {
+    'num_ants': 5,
+    'initial_pheromone': 0.554,
+    'alpha': 1.182,
+    'beta': 0.497,
+    'evap_coeff': 0.892,
+    'Q': 75.021,
+    'max_iterations': None,
+    'tolerance': 1e-5,
+    'patience': None
+}
+
+
+class OnlineScheduler:
+    def __init__(self, workers, epoch_length=60.0, epoch_budget=0.5, params=None, capacity_aware=capacity_aware, transfer_aware=transfer_aware, rng=None):
+        """
+        Rolling-horizon scheduling of jobs arriving over time.
+
+        At every decision epoch, the jobs that arrived and are not started yet are assigned with
+        the anytime solver, within a bounded solve time. The makespan of a worker counts the time
+        left on the jobs already committed to it. Only the jobs given to a worker that becomes free
+        before the next epoch are committed (dispatched); the others go back to the queue and are
+        re-optimized with the next arrivals. Pheromone carries over from one epoch to the next:
+        jobs still queued keep their own levels, new jobs start from the levels learned on their
+        job type (see warm_start).
+
+        :param workers: List of workers.
+        :param epoch_length: Time between two decision epochs, in the time unit of the durations.
+        :param epoch_budget: Wall-clock budget of the solve of an epoch, in seconds.
+        :param params: Dictionary of solver parameters overriding EPOCH_PARAMS.
+        :param capacity_aware: Resource model of the makespan simulation (see configure_worker_duration).
+        :param transfer_aware: Count the Docker image and result transfers, as the static solver does. The
+                               master builds the images of the queued jobs from the epoch on, in arrival
+                               order (TransferCosts of the queue); without it the epochs count compute time only.
+        :param rng: Seed or numpy Generator from which the stream of every epoch is spawned.
+        """
+        self.workers = workers
+        self.epoch_length = epoch_length
+        self.epoch_budget = epoch_budget
+        self.params = {**EPOCH_PARAMS, **(params or {})}
+        self.capacity_aware = capacity_aware
+        self.transfer_aware = transfer_aware
+        self.rng = make_rng(rng)
+        self.queue = []  # Jobs arrived and not started yet
+        self.arrival_times = {}
+        self.busy_until = {worker.name: 0.0 for worker in workers}  # End of the work committed to each worker
+        self.schedule = []  # Committed (job, worker, dispatch time) triples
+        self.levels = {}  # (job, worker name) -> pheromone of the queued jobs at the end of the last epoch
+        self.type_levels = {}  # Pheromone table per job type (export_pheromones)
+        self.scale = self.params['initial_pheromone']  # Highest pheromone level at the end of the last epoch
+        self.epochs = 0
+        self.changed = False
+        self.available = None
+
+    def submit(self, job, arrival_time):
+        """
+        Adds an arriving job to the queue of the next epoch.
+        """
+        self.queue.append(job)
+        self.arrival_times[job] = arrival_time
+        self.changed = True
+
+    def committed_load(self, now):
+        """
+        Returns the time left on the work committed to each worker at time `now`.
+        """
+        return {name: max(0.0, end - now) for name, end in self.busy_until.items()}
+
+    def step(self, now):
+        """
+        Runs the decision epoch at time `now`.
+
+        The solve is skipped when nothing changed since the previous epoch (no arrival, no worker
+        becoming free), since it would reach the same decision.
+
+        :return: List of the (job, worker, dispatch time) triples committed at this epoch.
+        """
+        load = self.committed_load(now)
+        available = {name for name, left in load.items() if left < self.epoch_length}
+        if not self.queue or (not self.changed and available == self.available):
+            return []
+        self.changed = False
+        self.available = available
+
+        transfer_costs = TransferCosts(self.queue, self.workers) if self.transfer_aware else None
+        configure_worker_duration(self.capacity_aware, transfer_costs, committed_load=load)
+        matches = self._matches()
+        ants = [Ant(id=j) for j in range(1, self.params['num_ants'] + 1)]
+        best = run_anytime(self.queue, self.workers, matches, ants, self.params['alpha'], self.params['beta'],
+                           self.params['evap_coeff'], self.params['Q'], time_budget=self.epoch_budget,
+                           max_iterations=self.params['max_iterations'], tolerance=self.params['tolerance'],
+                           patience=self.params['patience'], rng=self.rng)
+        self.epochs += 1
+
+        # Commit the jobs of the workers that become free before the next epoch
+        batches = {}
+        for job, worker in best.best_path:
+            if worker.name in available:
+                batches.setdefault(worker, []).append(job)
+        dispatched = []
+        for worker, jobs in batches.items():
+            # The simulated duration already includes the committed load of the worker
+            self.busy_until[worker.name] = now + worker_duration_cache(jobs, worker)
+            dispatched.extend((job, worker, now) for job in jobs)
+        self.schedule.extend(dispatched)
+
+        committed = {job for job, _, _ in dispatched}
+        self.queue = [job for job in self.queue if job not in committed]
+        self.type_levels.update(export_pheromones(matches))
+        self.levels = {(match.value[0], match.value[1].name): match.pheromone
+                       for match in matches if match.value[0] not in committed}
+        self.scale = max(match.pheromone for match in matches)
+        return dispatched
+
+    def run(self, arrivals):
+        """
+        Schedules a stream of arrivals, with an epoch every epoch_length until every job is committed.
+
+        :param arrivals: List of (arrival time, job) pairs.
+        :return: A tuple (schedule as (job, worker, dispatch time) triples, time at which all the work is done).
+        """
+        arrivals = sorted(arrivals, key=lambda arrival: arrival[0])
+        compute = worker_duration_cache.compute
+        try:
+            now = arrivals[0][0] if arrivals else 0.0
+            position = 0
+            while position < len(arrivals) or self.queue:
+                while position < len(arrivals) and arrivals[position][0] <= now:
+                    self.submit(arrivals[position][1], arrivals[position][0])
+                    position += 1
+                self.step(now)
+                now += self.epoch_length
+        finally:
+            # Back to the evaluation mode of the static solvers
+            worker_duration_cache.compute = compute
+            worker_duration_cache.clear()
+        return self.schedule, max(self.busy_until.values(), default=0.0)
+
+    def _matches(self):
+        """
+        Matches of the queued jobs, with the pheromone carried over from the previous epochs.
+        """
+        matches = create_matches(self.queue, self.workers, self.params['initial_pheromone'], capacity_aware=self.capacity_aware)
+        if self.type_levels:
+            # New jobs start from the levels of their type, on the scale reached by the previous epoch
+            seed_pheromones(matches, self.type_levels, 0.0, self.scale)
+        for match in matches:
+            level = self.levels.get((match.value[0], match.value[1].name))
+            if level is not None:
+                match.pheromone = level
+        return matches
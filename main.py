@@ -1,94 +1,138 @@
-import pandas as pd
 from models.ant import Ant
 # from algorithm.aco import ACO
-from algorithm.aco_elitist_minmax import ACO_elitist_minmax as ACO
+from algorithm.aco_elitist_minmax import ACO_elitist_minmax
+from algorithm.aco_vectorized import ACO_vectorized
+from algorithm.anytime import run_anytime
 from utils.method.evaluate import format_duration
 from utils.method.visualization import display_duration_per_worker 
-from utils.options import find_optimal, all_jobs, fine_tune, jobs, verbose, animate, learning_curve
-from utils.method.data_treatment import create_jobs_from_df, create_workers_from_df, create_matches
-from utils.method.optimization import deep_random_search_ACO, define_random_search_ranges, find_optimal_path, fine_tune_ACO, define_parameter_sets, random_search_ACO
+from utils.options import find_optimal, all_jobs, fine_tune, jobs, verbose, animate, learning_curve, engine, local_search, n_workers, trial_store, tuner, seed, derive_durations, instance_cache, solver_records, capacity_aware, transfer_aware, animation_stride, profile_path, time_budget, pheromone_store, replay_schedule
+from utils.method.data_treatment import create_matches
+from utils.method.instance_cache import load_problem
+from utils.method.pheromone_update import configure_worker_duration
+from utils.method.transfer_costs import TransferCosts
+from utils.method.profiling import PhaseTimer
+from utils.method.cluster_simulator import ClusterSimulator
+from utils.method.warm_start import export_pheromones, load_pheromones, save_pheromones, warm_start
+from utils.method.incremental_evaluation import improve_path
+from utils.method.optimization import deep_random_search_ACO, define_random_search_ranges, find_optimal_path, fine_tune_ACO, define_parameter_sets, random_search_ACO, successive_halving_ACO
 
-jobData = pd.read_csv(f"data/jobs{jobs}.csv")
-workersData = pd.read_csv("data/workers.csv")
+# Guarded so that process pools (n_workers > 1) can re-import this module safely
+if __name__ == "__main__":
+    ACO = ACO_vectorized if engine == "numpy" else ACO_elitist_minmax
 
-jobs = create_jobs_from_df(jobData)
-workers = create_workers_from_df(workersData)
+    # Durations are read for the workers listed in workers.csv; with instance_cache set, the CSV files
+    # are only parsed when they change and the compiled arrays are memory-mapped (also by pool processes)
+    instance, jobs, workers = load_problem(f"data/jobs{jobs}.csv", "data/workers.csv", instance_cache, derive_durations, solver_records)
+    if transfer_aware:
+        configure_worker_duration(capacity_aware, TransferCosts(jobs, workers))
 
-matches = create_matches(jobs,workers,0.554)    
-ants = []
-for i in range(1, 6):
-    ants.append(Ant(id=i))
+    matches = create_matches(jobs,workers,0.554,capacity_aware=capacity_aware)    
+    if pheromone_store:
+        # Start from the levels learned on previous batches of the same job types
+        pheromone_table = load_pheromones(pheromone_store)
+        warm_start(jobs, matches, pheromone_table, 0.892)
+    ants = []
+    for i in range(1, 6):
+        ants.append(Ant(id=i))
 
-optimal_path, total_duration = ACO(jobs, workers, matches, ants, alpha=1.182, beta=0.497, evap_coeff=0.892, Q=75.021, animate=animate, learning_curve=learning_curve, max_iterations=5000000, verbose=1, patience=5000)
+    profiler = PhaseTimer() if profile_path else None
+    if time_budget:
+        # Best assignment found within the budget. The anytime solver is the Python elitist colony:
+        # engine, animate and learning_curve do not apply to it
+        if engine != "python":
+            print(f"time_budget is set: the {engine} engine is ignored, the anytime solver runs the Python colony")
+        best = run_anytime(jobs, workers, matches, ants, alpha=1.182, beta=0.497, evap_coeff=0.892, Q=75.021, time_budget=time_budget, verbose=verbose, rng=seed, profiler=profiler)
+        optimal_path, total_duration = best.best_path, best.makespan
+        print(f"Best makespan after {best.elapsed:.2f} s: {format_duration(total_duration)}")
+    else:
+        optimal_path, total_duration = ACO(jobs, workers, matches, ants, alpha=1.182, beta=0.497, evap_coeff=0.892, Q=75.021, animate=animate, animation_stride=animation_stride, learning_curve=learning_curve, max_iterations=5000000, verbose=1, patience=5000, rng=seed, profiler=profiler)
+    if pheromone_store:
+        save_pheromones({**pheromone_table, **export_pheromones(matches)}, pheromone_store)
+    if profiler:
+        profiler.dump(profile_path)
+        print(profiler.report())
 
-display_duration_per_worker(optimal_path)
+    if local_search:
+        optimal_path, total_duration = improve_path(optimal_path, workers, capacity_aware=capacity_aware)
+        print(f"Makespan after local search: {format_duration(total_duration)}")
 
-# print("Optimal Path:")
-# for job, worker in optimal_path:
-#     print(f"Job: {job.name}, Worker: {worker.name}")
+    display_duration_per_worker(optimal_path)
 
-if find_optimal:
-    best_path, lowest_duration, mean_duration = find_optimal_path(jobs, workers,iterations=100, verbose=verbose)
+    if replay_schedule:
+        # Same resource model and transfer costs as the makespan evaluation of the run
+        simulation = ClusterSimulator(workers, capacity_aware, TransferCosts(jobs, workers) if transfer_aware else None).run(optimal_path)
+        print(simulation.report())
+
+    # print("Optimal Path:")
+    # for job, worker in optimal_path:
+    #     print(f"Job: {job.name}, Worker: {worker.name}")
+
+    if find_optimal:
+        best_path, lowest_duration, mean_duration = find_optimal_path(jobs, workers,iterations=100, verbose=verbose, n_workers=n_workers, rng=seed, instance=instance)
     
-    print("Optimal Path:", [(job.name, worker.name) for job, worker in best_path])
-    print("Lowest Total Duration:", format_duration(lowest_duration))
+        print("Optimal Path:", [(job.name, worker.name) for job, worker in best_path])
+        print("Lowest Total Duration:", format_duration(lowest_duration))
 
-if all_jobs:
-    # Define dataset paths
-    job_datasets = [f"data/jobs{i}.csv" for i in range(9, 91, 9)]
+    if all_jobs:
+        # Define dataset paths
+        job_datasets = [f"data/jobs{i}.csv" for i in range(9, 91, 9)]
     
-    results = []
+        results = []
     
-    for job_path in job_datasets:
-        # Load jobs data for each dataset
-        job_data = pd.read_csv(job_path)
-        jobs = create_jobs_from_df(job_data)
+        for job_path in job_datasets:
+            # Load jobs data for each dataset
+            instance, jobs, workers = load_problem(job_path, "data/workers.csv", instance_cache, derive_durations, solver_records)
+            if transfer_aware:
+                configure_worker_duration(capacity_aware, TransferCosts(jobs, workers))
     
-        # Run ACO
-        optimal_path, total_duration, mean_duration = find_optimal_path(jobs, workers ,verbose=verbose)
+            # Run ACO
+            optimal_path, total_duration, mean_duration = find_optimal_path(jobs, workers ,verbose=verbose, n_workers=n_workers, rng=seed, instance=instance)
     
-        # Store the result with path and duration
-        results.append({
-        "job_dataset": job_path,
-        "optimal_path": [(job.name, worker.name) for job, worker in optimal_path],
-        "total_duration": total_duration
-        })
+            # Store the result with path and duration
+            results.append({
+            "job_dataset": job_path,
+            "optimal_path": [(job.name, worker.name) for job, worker in optimal_path],
+            "total_duration": total_duration
+            })
     
-    # Display results sorted by total duration
-    for result in sorted(results, key=lambda x: x["total_duration"]):
-        print(f"Dataset: {result['job_dataset']}")
-        print(f"Optimal Path: {result['optimal_path']}")
-        print(f"Total Duration: {format_duration(result['total_duration'])}")  # format as needed
-        print("\n")
+        # Display results sorted by total duration
+        for result in sorted(results, key=lambda x: x["total_duration"]):
+            print(f"Dataset: {result['job_dataset']}")
+            print(f"Optimal Path: {result['optimal_path']}")
+            print(f"Total Duration: {format_duration(result['total_duration'])}")  # format as needed
+            print("\n")
 
 
-if fine_tune:
-    # Usage to retrieve parameter sets
-    # initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values = define_parameter_sets(jobs, workers)
-    param_ranges = define_random_search_ranges(jobs)
-    if verbose: 
-        print("Initial Pheromones:", param_ranges['initial_pheromones'])
-        print("Number of Ants:", param_ranges["num_ants_list"])
-        print("Alpha Values:", param_ranges["alpha_values"])
-        print("Beta Values:", param_ranges["beta_values"])
-        print("Evaporation Coefficients:", param_ranges["evap_coeffs"])
-        print("Q Values:", param_ranges["Q_values"])
-    # Run the fine-tuning function
-    # fine_tune_ACO(jobs, workers, initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values)
-    best_results = random_search_ACO(jobs, workers, param_ranges)
-    # Run Deep Random Search
-    # best_params, best_duration = deep_random_search_ACO(
-    #     jobs=jobs,
-    #     workers=workers,
-    #     param_ranges=param_ranges,
-    #     num_trials=100,
-    #     max_iterations=200,
-    #     inner_iterations=10,
-    #     tolerance=1e-5,
-    #     min_interval_width=1e-3,
-    #     max_depth=10
-    # )
+    if fine_tune:
+        # Usage to retrieve parameter sets
+        # initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values = define_parameter_sets(jobs, workers)
+        param_ranges = define_random_search_ranges(jobs)
+        if verbose: 
+            print("Initial Pheromones:", param_ranges['initial_pheromones'])
+            print("Number of Ants:", param_ranges["num_ants_list"])
+            print("Alpha Values:", param_ranges["alpha_values"])
+            print("Beta Values:", param_ranges["beta_values"])
+            print("Evaporation Coefficients:", param_ranges["evap_coeffs"])
+            print("Q Values:", param_ranges["Q_values"])
+        # Run the fine-tuning function
+        # fine_tune_ACO(jobs, workers, initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values)
+        if tuner == "halving":
+            best_results = successive_halving_ACO(jobs, workers, param_ranges, n_workers=n_workers, store_path=trial_store, rng=seed, instance=instance)
+        else:
+            best_results = random_search_ACO(jobs, workers, param_ranges, n_workers=n_workers, store_path=trial_store, rng=seed, instance=instance)
+        # Run Deep Random Search
+        # best_params, best_duration = deep_random_search_ACO(
+        #     jobs=jobs,
+        #     workers=workers,
+        #     param_ranges=param_ranges,
+        #     num_trials=100,
+        #     max_iterations=200,
+        #     inner_iterations=10,
+        #     tolerance=1e-5,
+        #     min_interval_width=1e-3,
+        #     max_depth=10
+        # )
 
-    # print("\nFinal Best Parameters:")
-    # print(best_params)
-    # print(f"Best Duration: {best_duration}")
\ No newline at end of file
+        # print("\nFinal Best Parameters:")
+        # print(best_params)
+        # print(f"Best Duration: {best_duration}")
\ No newline at end of file
@@ -1,4 +1,5 @@
 class Ant:
-    def __init__(self, id, path=[]):
+    def __init__(self, id, path=[], rng=None):
         self.id = id
-        self.path = path
\ No newline at end of file
+        self.path = path
+        self.rng = rng  # Random stream of the ant (numpy Generator), None to use the colony's
@@ -36,11 +36,9 @@ class Job(Thread):  # Inherit from threading.Thread to make the class runnable
             if self.assigned_worker:
                 print(f"{self.assigned_worker.name}---<< {self.name} <<---")
 
-                # Simulating processing time based on the assigned worker's CPU info
-                family_name = self.assigned_worker.cpu_info['family_name']
-                denomination = self.assigned_worker.cpu_info['denomination']
-                cores = self.assigned_worker.cpu_info['number_of_cores']
-                key = f"{family_name}-{denomination}-{cores}"
+                # Durations are keyed by worker name (see create_jobs_from_df); cpu_info is a CPU object.
+                # Real time: use utils/method/cluster_simulator.py to replay a schedule on a virtual clock
+                key = self.assigned_worker.name
 
                 # Sleep for the standard processing duration
                 if key in self.standard_processing_durations:
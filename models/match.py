@@ -1,10 +1,70 @@
 class Match:
-    def __init__(self, value, pheromone):
+    def __init__(self, value, pheromone, processing_duration=None):
         self.value = value  # value is expected to be a tuple (job, worker)
         self.pheromone = pheromone
-        self.processing_duration = self.calculate_processing_duration()
+        # Taken from the duration matrix when given, otherwise looked up in the job
+        self.processing_duration = self.calculate_processing_duration() if processing_duration is None else processing_duration
 
     def calculate_processing_duration(self):
         job, worker = self.value
         # Use the worker's name (e.g., 'PC1') to get the correct duration from the job's dictionary
         return job.standard_processing_durations[worker.name]  # Assume worker has an 'name' or identifier like 'PC1'
+
+
+class MatchTable:
+    def __init__(self, jobs, workers, matches=None):
+        """
+        Indexed table of matches, grouped per job and addressable by (job index, worker index).
+        Iterating over the table yields the matches in the same order as the flat list.
+        """
+        self.jobs = jobs
+        self.workers = workers
+        self.job_indices = {job: j for j, job in enumerate(jobs)}
+        self.worker_indices = {worker: w for w, worker in enumerate(workers)}
+        self.rows = [[] for _ in jobs]  # Matches of each job, in worker order
+        self.cells = {}  # (job index, worker index) -> Match
+        self.flat = None  # Matches in iteration order, built on the first integer access after a change
+        for match in matches or []:
+            self.add(match)
+
+    def add(self, match):
+        """
+        Adds a match to the table.
+        """
+        job, worker = match.value
+        j, w = self.job_indices[job], self.worker_indices[worker]
+        self.rows[j].append(match)
+        self.cells[(j, w)] = match
+        self.flat = None
+
+    def job_index(self, job):
+        return self.job_indices[job]
+
+    def worker_index(self, worker):
+        return self.worker_indices[worker]
+
+    def job_matches(self, job):
+        """
+        Returns the matches of the given job.
+        """
+        return self.rows[self.job_indices[job]]
+
+    def match(self, job, worker):
+        """
+        Returns the match of the given job-worker pair.
+        """
+        return self.cells[(self.job_indices[job], self.worker_indices[worker])]
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.cells[key]
+        if self.flat is None:
+            self.flat = list(self)
+        return self.flat[key]
+
+    def __iter__(self):
+        for row in self.rows:
+            yield from row
+
+    def __len__(self):
+        return len(self.cells)
@@ -0,0 +1,125 @@
+from models.job import Job
+from models.worker import Worker
+from models.cpu import CPU
+
+class JobRecord:
+    """
+    Lightweight, picklable job used on the solver side.
+
+    Holds only the fields read by the colony and the makespan simulation, under the same
+    attribute names as Job, so both can be passed to the solver functions.
+    """
+    __slots__ = ('ID', 'name', 'standard_processing_durations', 'required_memory_size_for_execution',
+                 'required_disk_size_for_execution', 'docker_file_size', 'estimated_result_file_size',
+                 'docker_file_generation_duration_on_master_pc', 'thread_process_count')
+
+    def __init__(self, ID=0, name="", standard_processing_durations=None, required_memory_size_for_execution=0.0,
+                 required_disk_size_for_execution=0.0, docker_file_size=0.0, estimated_result_file_size=0.0,
+                 docker_file_generation_duration_on_master_pc=0.0, thread_process_count=1):
+        self.ID = ID
+        self.name = name
+        self.standard_processing_durations = standard_processing_durations if standard_processing_durations is not None else {}
+        self.required_memory_size_for_execution = required_memory_size_for_execution
+        self.required_disk_size_for_execution = required_disk_size_for_execution
+        self.docker_file_size = docker_file_size
+        self.estimated_result_file_size = estimated_result_file_size
+        self.docker_file_generation_duration_on_master_pc = docker_file_generation_duration_on_master_pc
+        self.thread_process_count = thread_process_count
+
+    @classmethod
+    def from_job(cls, job):
+        """
+        Creates the record of a Job (the durations dictionary is shared, not copied).
+        """
+        return cls(job.ID, job.name, job.standard_processing_durations, job.required_memory_size_for_execution,
+                   job.required_disk_size_for_execution, job.docker_file_size, job.estimated_result_file_size,
+                   job.docker_file_generation_duration_on_master_pc, job.thread_process_count)
+
+    def to_job(self):
+        """
+        Creates a full Job object from this record.
+        """
+        return Job(ID=self.ID,
+                   name=self.name,
+                   standard_processing_durations=dict(self.standard_processing_durations),
+                   required_memory_size_for_execution=self.required_memory_size_for_execution,
+                   required_disk_size_for_execution=self.required_disk_size_for_execution,
+                   docker_file_size=self.docker_file_size,
+                   estimated_result_file_size=self.estimated_result_file_size,
+                   docker_file_generation_duration_on_master_pc=self.docker_file_generation_duration_on_master_pc,
+                   thread_process_count=self.thread_process_count)
+
+    def duplicate(self):
+        """
+        Returns a copy of this record with its own durations dictionary.
+        """
+        copy = JobRecord.from_job(self)
+        copy.standard_processing_durations = dict(self.standard_processing_durations)
+        return copy
+
+
+class CPURecord:
+    """
+    Lightweight CPU description of a WorkerRecord.
+    """
+    __slots__ = ('number_of_cores', 'clock_rate_in_hz', 'family_name', 'denomination')
+
+    def __init__(self, number_of_cores=0, clock_rate_in_hz=0.0, family_name='', denomination=''):
+        self.number_of_cores = number_of_cores
+        self.clock_rate_in_hz = clock_rate_in_hz
+        self.family_name = family_name
+        self.denomination = denomination
+
+
+class WorkerRecord:
+    """
+    Lightweight, picklable worker used on the solver side, with the same attribute names as Worker.
+    """
+    __slots__ = ('ID', 'name', 'cpu_info', 'available_memory_size', 'available_disk_size',
+                 'connection_bandwidth_with_master_pc', 'connection_delay_with_master_pc')
+
+    def __init__(self, ID=0, name="", cpu_info=None, available_memory_size=0.0, available_disk_size=0.0,
+                 connection_bandwidth_with_master_pc=0.0, connection_delay_with_master_pc=0.0):
+        self.ID = ID
+        self.name = name
+        self.cpu_info = cpu_info if cpu_info is not None else CPURecord()
+        self.available_memory_size = available_memory_size
+        self.available_disk_size = available_disk_size
+        self.connection_bandwidth_with_master_pc = connection_bandwidth_with_master_pc
+        self.connection_delay_with_master_pc = connection_delay_with_master_pc
+
+    @classmethod
+    def from_worker(cls, worker):
+        """
+        Creates the record of a Worker.
+        """
+        cpu = worker.cpu_info
+        return cls(worker.ID, worker.name,
+                   CPURecord(cpu.number_of_cores, cpu.clock_rate_in_hz, cpu.family_name, cpu.denomination),
+                   worker.available_memory_size, worker.available_disk_size,
+                   worker.connection_bandwidth_with_master_pc, worker.connection_delay_with_master_pc)
+
+    def to_worker(self):
+        """
+        Creates a full Worker object from this record.
+        """
+        cpu = self.cpu_info
+        return Worker(ID=self.ID,
+                      cpu_info=CPU(number_of_cores=cpu.number_of_cores, clock_rate_in_hz=cpu.clock_rate_in_hz,
+                                   family_name=cpu.family_name, denomination=cpu.denomination),
+                      available_memory_size=self.available_memory_size,
+                      available_disk_size=self.available_disk_size,
+                      connection_bandwidth_with_master_pc=self.connection_bandwidth_with_master_pc,
+                      connection_delay_with_master_pc=self.connection_delay_with_master_pc,
+                      name=self.name,
+                      cpu_usage_in_percentage=0.0,
+                      current_global_cpu_time=0.0)
+
+    def can_handle_job(self, job):
+        if self.available_memory_size < job.required_memory_size_for_execution:
+            return False
+        if self.available_disk_size < job.required_disk_size_for_execution:
+            return False
+        if self.cpu_info.number_of_cores < job.thread_process_count:
+            return False
+        return True
@@ -0,0 +1,38 @@
+import pytest
+from utils.method.data_treatment import create_matches
+from utils.method.evaluate import evaluate
+from utils.method.incremental_evaluation import IncrementalEvaluator, improve_path
+from utils.method.instance_cache import load_problem
+from utils.method.pheromone_update import configure_worker_duration
+
+
+@pytest.fixture
+def capacity_aware_mode():
+    configure_worker_duration(capacity_aware=True)
+    yield
+    configure_worker_duration(capacity_aware=False)
+
+
+def test_improve_path_keeps_jobs_on_workers_that_can_handle_them(capacity_aware_mode):
+    _, jobs, workers = load_problem("data/jobs27.csv", "data/workers.csv", records=True)
+    path, makespan = evaluate(jobs, create_matches(jobs, workers, 0.554, capacity_aware=True))
+
+    improved, improved_makespan = improve_path(path, workers, capacity_aware=True)
+
+    assert improved_makespan <= makespan
+    assert all(worker.can_handle_job(job) for job, worker in improved)
+
+
+def test_infeasible_moves_and_swaps_are_skipped(capacity_aware_mode):
+    _, jobs, workers = load_problem("data/jobs27.csv", "data/workers.csv", records=True)
+    path, _ = evaluate(jobs, create_matches(jobs, workers, 0.554, capacity_aware=True))
+    evaluator = IncrementalEvaluator(path, capacity_aware=True)
+    big = max(jobs, key=lambda job: job.thread_process_count)
+    small_worker = min(workers, key=lambda worker: worker.cpu_info.number_of_cores)
+    other = next(job for job, worker in path if worker is small_worker)
+    before = evaluator.path()
+
+    evaluator.move(big, evaluator.assignment[big], small_worker)
+    evaluator.swap(big, other)
+
+    assert evaluator.path() == before
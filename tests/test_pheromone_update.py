@@ -0,0 +1,17 @@
+import pytest
+from utils.method.pheromone_update import init_min_max_pheromones
+
+
+@pytest.mark.parametrize("n_decisions", [1, 2, 3, 4])
+def test_small_batches_keep_tau_min_below_tau_max(n_decisions):
+    tau_min, tau_max = init_min_max_pheromones(0.892, 1000.0, n_decisions)
+    assert 0 < tau_min < tau_max
+
+
+@pytest.mark.parametrize("n_decisions", [5, 9, 27, 90])
+def test_stutzle_hoos_bound(n_decisions):
+    p_dec = 0.05 ** (1 / n_decisions)
+    tau_min, tau_max = init_min_max_pheromones(0.892, 1000.0, n_decisions)
+    assert tau_max == pytest.approx(1 / (0.892 * 1000.0))
+    assert tau_min == pytest.approx(tau_max * (1 - p_dec) / ((n_decisions / 2 - 1) * p_dec))
+    assert tau_min < tau_max
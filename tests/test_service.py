@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from utils.method.data_treatment import create_job_records, create_worker_records
+from utils.method.instance_cache import load_problem
+from utils.method.optimization import run_restart
+from utils.method.service import DEFAULT_PARAMS, LocalDispatcher, SchedulingService
+
+PARAMS = {'max_iterations': 20, 'patience': 5}
+
+
+class CountingExecutor(ProcessPoolExecutor):
+    """
+    Process pool recording the highest number of solves submitted and not finished at once.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.outstanding = 0
+        self.peak = 0
+
+    def submit(self, *args, **kwargs):
+        with self.lock:
+            self.outstanding += 1
+            self.peak = max(self.peak, self.outstanding)
+        future = super().submit(*args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        with self.lock:
+            self.outstanding -= 1
+
+
+@pytest.fixture(scope="module")
+def problem():
+    _, jobs, workers = load_problem("data/jobs9.csv", "data/workers.csv", records=True)
+    return jobs, workers
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with CountingExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def test_identical_requests_share_one_solve(problem, executor):
+    jobs, workers = problem
+    service = SchedulingService(max_in_flight=2, executor=executor)
+    dispatcher = LocalDispatcher(service)
+    results = asyncio.run(dispatcher.replay([(jobs, workers, PARAMS, 3)] * 5))
+
+    assert service.stats() == {'requests': 5, 'coalesced': 4, 'solves': 1, 'in_flight': 0}
+    assert all(result == results[0] for result in results)
+    # Same colony as a seeded restart in this process
+    _, makespan = run_restart(create_job_records(jobs), create_worker_records(workers), {**DEFAULT_PARAMS, **PARAMS}, 3)
+    assert results[0][1] == makespan
+
+
+def test_semaphore_caps_solves_in_flight(problem, executor):
+    jobs, workers = problem
+    executor.peak = 0
+    service = SchedulingService(max_in_flight=1, executor=executor)
+    results = asyncio.run(LocalDispatcher(service).replay([(jobs, workers, PARAMS, seed) for seed in range(4)]))
+
+    assert service.stats()['solves'] == 4
+    assert executor.peak == 1
+    assert len(results) == 4
+
+
+def test_time_budget_uses_anytime_solver(problem, executor):
+    jobs, workers = problem
+    service = SchedulingService(executor=executor)
+    assignment, makespan = asyncio.run(LocalDispatcher(service).assign(jobs, workers, {'time_budget': 0.2, 'capacity_aware': True}, 1))
+
+    assert sorted(job for job, _ in assignment) == sorted(job.name for job in jobs)
+    assert makespan > 0
+
+
+def test_thread_pool_is_refused():
+    with ThreadPoolExecutor() as pool:
+        with pytest.raises(ValueError):
+            SchedulingService(executor=pool)
@@ -0,0 +1,92 @@
+import glob
+import pytest
+import numpy as np
+from models.records import JobRecord
+from utils.method.instance_cache import load_problem
+from utils.method.pheromone_update import calculate_worker_duration
+
+
+def rescan_worker_duration(jobs, worker):
+    """
+    Historical calculate_worker_duration (rescans every pending job after each completion), kept as the reference.
+    """
+    jobs = sorted(jobs, key=lambda job: job.standard_processing_durations[worker.name])
+
+    total_time = 0
+    available_memory = worker.available_memory_size
+    available_disk = worker.available_disk_size
+    available_cores = 20
+
+    executing_jobs = []
+    remaining_durations = {job: job.standard_processing_durations[worker.name] for job in jobs}
+
+    while jobs or executing_jobs:
+        remaining_jobs = []
+        for job in jobs:
+            if (available_memory >= job.required_memory_size_for_execution and
+                available_disk >= job.required_disk_size_for_execution and
+                available_cores >= job.thread_process_count):
+                executing_jobs.append(job)
+                available_memory -= job.required_memory_size_for_execution
+                available_disk -= job.required_disk_size_for_execution
+                available_cores -= job.thread_process_count
+            else:
+                remaining_jobs.append(job)
+
+        if executing_jobs:
+            min_duration = min(remaining_durations[job] for job in executing_jobs)
+            total_time += min_duration
+
+            completed_jobs = []
+            for job in executing_jobs:
+                remaining_durations[job] -= min_duration
+                if remaining_durations[job] == 0:
+                    available_memory += job.required_memory_size_for_execution
+                    available_disk += job.required_disk_size_for_execution
+                    available_cores += job.thread_process_count
+                    completed_jobs.append(job)
+
+            executing_jobs = [job for job in executing_jobs if job not in completed_jobs]
+
+        jobs = remaining_jobs
+
+    return total_time
+
+
+def assignments(jobs, workers, rng, count=20):
+    """
+    Yields (jobs, worker) groups: every job a worker can run, then random assignments of the jobs.
+    """
+    for worker in workers:
+        yield [job for job in jobs if worker.name in job.standard_processing_durations], worker
+    for _ in range(count):
+        groups = {worker: [] for worker in workers}
+        for job in jobs:
+            candidates = [worker for worker in workers if worker.name in job.standard_processing_durations]
+            groups[candidates[rng.integers(len(candidates))]].append(job)
+        yield from ((group, worker) for worker, group in groups.items())
+
+
+@pytest.mark.parametrize("jobs_csv", sorted(glob.glob("data/jobs*.csv")))
+def test_heap_matches_rescan(jobs_csv):
+    _, jobs, workers = load_problem(jobs_csv, "data/workers.csv", records=True)
+    rng = np.random.default_rng(0)
+    for group, worker in assignments(jobs, workers, rng):
+        assert calculate_worker_duration(group, worker) == pytest.approx(rescan_worker_duration(group, worker))
+
+
+def test_job_that_never_fits_raises():
+    _, jobs, workers = load_problem("data/jobs9.csv", "data/workers.csv", records=True)
+    worker = workers[0]
+    job = jobs[0]
+    too_big = JobRecord(ID=job.ID, name=job.name, standard_processing_durations=job.standard_processing_durations,
+                        required_memory_size_for_execution=worker.available_memory_size * 2,
+                        required_disk_size_for_execution=job.required_disk_size_for_execution,
+                        thread_process_count=job.thread_process_count)
+    # The rescan routine looped forever on such a job
+    with pytest.raises(ValueError):
+        calculate_worker_duration([jobs[1], too_big], worker)
+    many_threads = JobRecord(ID=job.ID, name=job.name, standard_processing_durations=job.standard_processing_durations,
+                             thread_process_count=worker.cpu_info.number_of_cores + 1)
+    with pytest.raises(ValueError):
+        calculate_worker_duration([many_threads], worker, capacity_aware=True)
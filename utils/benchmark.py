@@ -0,0 +1,294 @@
+"""
+Benchmark of the ACO solver over the data/jobs{9..90}.csv datasets.
+
+Every dataset is solved under fixed seeds; the throughput (iterations and makespan evaluations
+per second), the time needed to reach the target makespan, the final makespan and the peak
+memory are written to a JSON file and compared with a stored baseline.
+
+Usage, from the root of the repository:
+    python -m utils.benchmark                     # run and compare with the baseline
+    python -m utils.benchmark --save-baseline     # run and store the results as the new baseline
+    python -m utils.benchmark --datasets 9 27 --seeds 0 1
+
+The process exits with status 1 when a dataset regresses beyond the thresholds, and with status 2
+without running anything when the baseline was measured with another engine, other seeds, other
+solver settings or another evaluation mode (capacity_aware and transfer_aware in utils/options.py;
+--allow-mismatch compares anyway, with a warning).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+
+from models.ant import Ant
+from algorithm.aco_elitist_minmax import ACO_elitist_minmax
+from algorithm.aco_vectorized import ACO_vectorized
+from utils.method.data_treatment import create_matches
+from utils.method.instance_cache import load_problem
+from utils.method.pheromone_update import configure_worker_duration
+from utils.method.profiling import PhaseTimer
+from utils.method.reporting import Reporter
+from utils.method.transfer_costs import TransferCosts
+from utils.options import instance_cache, capacity_aware, transfer_aware
+
+DATASETS = list(range(9, 91, 9))
+SEEDS = [0, 1, 2]
+RESULTS_PATH = "output/benchmark.json"
+BASELINE_PATH = "output/benchmark_baseline.json"
+THROUGHPUT_THRESHOLD = 0.20  # Relative drop of iterations per second tolerated
+QUALITY_THRESHOLD = 0.02  # Relative increase of the mean final makespan tolerated
+
+# Solver settings of main.py, with a bounded number of iterations
+SETTINGS = {
+    'initial_pheromone': 0.554,
+    'num_ants': 5,
+    'alpha': 1.182,
+    'beta': 0.497,
+    'evap_coeff': 0.892,
+    'Q': 75.021,
+    'max_iterations': 500,
+    'patience': 100
+}
+
+
+class TimedReporter(Reporter):
+    """
+    Reporter keeping the time elapsed since the start of the run at every recorded makespan.
+    """
+    def __init__(self):
+        super().__init__()
+        self.started = None
+        self.times = []
+
+    def start(self, jobs, workers, matches):
+        super().start(jobs, workers, matches)
+        self.times = []
+        self.started = perf_counter()
+
+    def record(self, iteration, makespan, pheromone):
+        super().record(iteration, makespan, pheromone)
+        self.times.append(perf_counter() - self.started)
+
+    def time_to(self, target):
+        """
+        Returns the time at which the makespan first reached the target, None if it never did.
+        """
+        for makespan, time in zip(self.history, self.times):
+            if makespan <= target:
+                return time
+        return None
+
+
+def run_once(jobs, workers, seed, engine="python", trace_memory=False, settings=SETTINGS):
+    """
+    Solves an instance once with a fresh worker duration cache, under the evaluation mode of
+    utils/options.py (capacity_aware, transfer_aware) as in main.py.
+
+    :param seed: Seed of the run.
+    :param engine: "python" (ACO_elitist_minmax) or "numpy" (ACO_vectorized).
+    :param trace_memory: Measure the peak memory of the run with tracemalloc (which slows it down).
+    :return: A tuple (dictionary of the figures of the run, TimedReporter of the run).
+    """
+    ACO = ACO_vectorized if engine == "numpy" else ACO_elitist_minmax
+    configure_worker_duration(capacity_aware, TransferCosts(jobs, workers) if transfer_aware else None)
+    matches = create_matches(jobs, workers, settings['initial_pheromone'], capacity_aware=capacity_aware)
+    ants = [Ant(id=i) for i in range(1, settings['num_ants'] + 1)]
+    tracker = TimedReporter()
+    profiler = PhaseTimer()
+
+    if trace_memory:
+        tracemalloc.start()
+    _, makespan = ACO(jobs, workers, matches, ants, settings['alpha'], settings['beta'], settings['evap_coeff'], settings['Q'],
+                      max_iterations=settings['max_iterations'], patience=settings['patience'], rng=seed,
+                      reporter=tracker, profiler=profiler)
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    summary = profiler.summary()
+    return {
+        'seed': seed,
+        'iterations': summary['iterations'],
+        'wall_time': summary['wall_time'],
+        'iterations_per_second': summary['iterations_per_second'],
+        'evaluations_per_second': summary['evaluations_per_second'],
+        'cache_hit_rate': summary['caches']['worker_duration']['hit_rate'],
+        'final_makespan': makespan,
+        'time_to_target': None,
+        'peak_memory': peak_memory
+    }, tracker
+
+
+def benchmark_dataset(size, seeds=SEEDS, engine="python", target=None, trace_memory=True, settings=SETTINGS):
+    """
+    Runs a dataset under every seed and aggregates the runs.
+
+    The timed runs are made without tracemalloc; with trace_memory, the first seed is run a second
+    time (same seed, so the same search) to measure the peak memory.
+
+    :param size: Number of jobs of the dataset (data/jobs{size}.csv).
+    :param target: Target makespan of the dataset, by default the best final makespan of the runs.
+    :return: Dictionary with the aggregated figures and the runs.
+    """
+    _, jobs, workers = load_problem(f"data/jobs{size}.csv", "data/workers.csv", instance_cache, records=True)
+    runs, trackers = zip(*[run_once(jobs, workers, seed, engine, settings=settings) for seed in seeds])
+    if target is None:
+        # Without a target, measure the time to the best makespan found over the seeds
+        target = min(run['final_makespan'] for run in runs)
+    for run, tracker in zip(runs, trackers):
+        run['time_to_target'] = tracker.time_to(target)
+    peak_memory = run_once(jobs, workers, seeds[0], engine, True, settings)[0]['peak_memory'] if trace_memory else None
+
+    reached = [run['time_to_target'] for run in runs if run['time_to_target'] is not None]
+    return {
+        'dataset': f"jobs{size}",
+        'target': target,
+        'iterations_per_second': statistics.median(run['iterations_per_second'] for run in runs),
+        'evaluations_per_second': statistics.median(run['evaluations_per_second'] for run in runs),
+        'mean_final_makespan': statistics.mean(run['final_makespan'] for run in runs),
+        'best_final_makespan': min(run['final_makespan'] for run in runs),
+        'target_reached': len(reached),
+        'median_time_to_target': statistics.median(reached) if reached else None,
+        'peak_memory': peak_memory,
+        'runs': list(runs)
+    }
+
+
+def compare(results, baseline, throughput_threshold=THROUGHPUT_THRESHOLD, quality_threshold=QUALITY_THRESHOLD):
+    """
+    Compares benchmark results with a baseline.
+
+    :param results: Dictionary dataset -> aggregated figures (benchmark_dataset).
+    :param baseline: Same layout, from a previous run.
+    :return: List of messages describing the regressions (empty if none).
+    """
+    regressions = []
+    for dataset, result in results.items():
+        reference = baseline.get(dataset)
+        if reference is None:
+            continue
+        minimum = reference['iterations_per_second'] * (1 - throughput_threshold)
+        if result['iterations_per_second'] < minimum:
+            regressions.append(f"{dataset}: {result['iterations_per_second']:.1f} it/s, "
+                               f"baseline {reference['iterations_per_second']:.1f} it/s")
+        maximum = reference['mean_final_makespan'] * (1 + quality_threshold)
+        if result['mean_final_makespan'] > maximum:
+            regressions.append(f"{dataset}: mean makespan {result['mean_final_makespan']:.1f}, "
+                               f"baseline {reference['mean_final_makespan']:.1f}")
+    return regressions
+
+
+def mismatches(baseline, engine, seeds, settings=SETTINGS):
+    """
+    Lists what differs between the conditions of a run (engine, seeds, settings and evaluation
+    mode) and those a baseline was measured with.
+
+    :param baseline: Content of a benchmark file (load_results).
+    :return: List of messages (empty if the results are comparable).
+    """
+    differences = []
+    if baseline.get('engine') != engine:
+        differences.append(f"engine {engine}, baseline {baseline.get('engine')}")
+    if baseline.get('seeds') != list(seeds):
+        differences.append(f"seeds {list(seeds)}, baseline {baseline.get('seeds')}")
+    if baseline.get('settings') != settings:
+        differences.append(f"settings {settings}, baseline {baseline.get('settings')}")
+    for mode, value in (('capacity_aware', capacity_aware), ('transfer_aware', transfer_aware)):
+        if baseline.get(mode) != value:
+            differences.append(f"{mode} {value}, baseline {baseline.get(mode)}")
+    return differences
+
+
+def load_results(path):
+    """
+    Reads a benchmark file (engine, seeds, settings, environment and per-dataset results), None if it does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(path, results, engine, seeds, settings=SETTINGS):
+    """
+    Writes benchmark results with the settings and environment they were measured with.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            'engine': engine,
+            'seeds': list(seeds),
+            'settings': settings,
+            'capacity_aware': capacity_aware,
+            'transfer_aware': transfer_aware,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'datasets': results
+        }, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of the ACO solver over the jobs datasets.")
+    parser.add_argument("--datasets", type=int, nargs="+", default=DATASETS, help="Sizes of the datasets (data/jobs{size}.csv).")
+    parser.add_argument("--seeds", type=int, nargs="+", default=SEEDS)
+    parser.add_argument("--engine", choices=("python", "numpy"), default="python")
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--throughput-threshold", type=float, default=THROUGHPUT_THRESHOLD)
+    parser.add_argument("--quality-threshold", type=float, default=QUALITY_THRESHOLD)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc runs.")
+    parser.add_argument("--allow-mismatch", action="store_true",
+                        help="Compare with a baseline measured with another engine, other seeds or other settings.")
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    differences = mismatches(baseline, args.engine, args.seeds) if baseline is not None else []
+    if differences and args.save_baseline:
+        baseline = None  # Replaced by a baseline of other conditions: its targets do not apply
+    elif differences:
+        for difference in differences:
+            print(f"{'WARNING' if args.allow_mismatch else 'MISMATCH'} {difference}")
+        if not args.allow_mismatch:
+            print(f"The baseline at {args.baseline} was measured under other conditions, "
+                  f"run with --save-baseline to replace it or --allow-mismatch to compare anyway")
+            return 2
+    baseline = baseline['datasets'] if baseline is not None else None
+
+    results = {}
+    for size in args.datasets:
+        dataset = f"jobs{size}"
+        # The target of a dataset is the quality of the baseline, so that time-to-target is comparable
+        target = baseline[dataset]['target'] if baseline and dataset in baseline else None
+        result = benchmark_dataset(size, args.seeds, args.engine, target, not args.no_memory)
+        results[dataset] = result
+        time_to_target = "-" if result['median_time_to_target'] is None else f"{result['median_time_to_target']:.3f} s"
+        peak_memory = "-" if result['peak_memory'] is None else f"{result['peak_memory'] / 2**20:.1f} MiB"
+        print(f"{dataset:>7}: {result['iterations_per_second']:8.1f} it/s  "
+              f"makespan {result['mean_final_makespan']:9.1f} (best {result['best_final_makespan']:.0f})  "
+              f"target {result['target_reached']}/{len(args.seeds)} in {time_to_target}  peak {peak_memory}")
+
+    save_results(args.output, results, args.engine, args.seeds)
+    if args.save_baseline:
+        save_results(args.baseline, results, args.engine, args.seeds)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, baseline, args.throughput_threshold, args.quality_threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
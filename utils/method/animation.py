@@ -0,0 +1,113 @@
+import os
+from io import BytesIO
+import numpy as np
+import networkx as nx
+from matplotlib.animation import AbstractMovieWriter, FFMpegWriter
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from PIL import Image, GifImagePlugin
+from utils.method.visualization import network_layout
+
+class StreamingGifWriter(AbstractMovieWriter):
+    """
+    Movie writer appending every grabbed frame to the GIF file right away.
+
+    Matplotlib's PillowWriter keeps all the frames in memory until the end; here only the
+    current frame is held. Every frame is mapped on the palette of the first one, which
+    suits figures whose colors do not change between frames.
+    """
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self._file = open(outfile, "wb")
+        self._palette = None
+
+    def grab_frame(self, **savefig_kwargs):
+        buffer = BytesIO()
+        self.fig.savefig(buffer, **{**savefig_kwargs, "format": "rgba", "dpi": self.dpi})
+        frame = Image.frombuffer("RGBA", self.frame_size, buffer.getbuffer(), "raw", "RGBA", 0, 1).convert("RGB")
+        if self._palette is None:
+            self._palette = frame.quantize(256)
+            for chunk in GifImagePlugin.getheader(self._palette, info={"loop": 0})[0]:
+                self._file.write(chunk)
+        frame = frame.quantize(palette=self._palette, dither=Image.Dither.NONE)
+        for chunk in GifImagePlugin.getdata(frame, offset=(0, 0), duration=int(1000 / self.fps)):
+            self._file.write(chunk)
+
+    def finish(self):
+        self._file.write(b";")  # GIF trailer
+        self._file.close()
+
+
+class NetworkAnimator:
+    def __init__(self, jobs, workers, matches, path="output/ACO_animation.gif", stride=1, fps=2, dpi=100):
+        """
+        Streams the pheromone levels of a run to an animation file, one frame every `stride` iterations.
+
+        The job-worker graph is drawn once; each frame only updates the edge widths of the
+        persistent figure and is passed straight to the movie writer, so memory use does not
+        grow with the number of iterations. A .mp4 path is written with ffmpeg when it is
+        installed (otherwise a .gif is written next to it); a .gif path is always streamed
+        by StreamingGifWriter.
+
+        :param jobs: List of job objects.
+        :param workers: List of worker objects.
+        :param matches: MatchTable of the run (its iteration order gives the edge order).
+        :param path: Path of the animation file.
+        :param stride: Number of iterations between two frames.
+        :param fps: Frames per second of the animation.
+        :param dpi: Resolution of the frames.
+        """
+        self.stride = max(1, int(stride))
+        self.rows = np.array([matches.job_index(match.value[0]) for match in matches], dtype=int)
+        self.cols = np.array([matches.worker_index(match.value[1]) for match in matches], dtype=int)
+
+        # A bare Figure (no pyplot): nothing is registered with a GUI backend
+        self.fig = Figure(figsize=(12, 8))
+        ax = self.fig.subplots()
+        job_nodes, worker_nodes, pos = network_layout(jobs, workers)
+        G = nx.Graph()
+        G.add_nodes_from(job_nodes + worker_nodes)
+        nx.draw_networkx_nodes(G, pos, nodelist=job_nodes, node_color='skyblue', node_size=300, label="Jobs", ax=ax)
+        nx.draw_networkx_nodes(G, pos, nodelist=worker_nodes, node_color='lightgreen', node_size=300, label="Workers", ax=ax)
+        nx.draw_networkx_labels(G, pos, font_size=10, font_color="black", ax=ax)
+        segments = [(pos[job_nodes[j]], pos[worker_nodes[w]]) for j, w in zip(self.rows, self.cols)]
+        self.edges = LineCollection(segments, colors="gray", alpha=0.5, zorder=1)
+        ax.add_collection(self.edges)
+        self.title = ax.set_title("")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith(".gif"):
+            self.writer = StreamingGifWriter(fps=fps)
+        elif FFMpegWriter.isAvailable():
+            self.writer = FFMpegWriter(fps=fps)
+        else:
+            path = os.path.splitext(path)[0] + ".gif"
+            print(f"ffmpeg is not available, writing the animation to {path}")
+            self.writer = StreamingGifWriter(fps=fps)
+        self.path = path
+        self.writer.setup(self.fig, path, dpi=dpi)
+
+    def update(self, iteration, pheromone):
+        """
+        Adds the frame of an iteration (skipped unless the iteration is a multiple of the stride).
+
+        :param iteration: Iteration number.
+        :param pheromone: The MatchTable of the run, or the jobs x workers pheromone array of the numpy engine.
+        """
+        if iteration % self.stride:
+            return
+        if isinstance(pheromone, np.ndarray):
+            levels = pheromone[self.rows, self.cols]
+        else:
+            levels = np.array([match.pheromone for match in pheromone])
+        self.edges.set_linewidths(150 * levels)
+        self.title.set_text(f"Iteration {iteration}")
+        self.writer.grab_frame()
+
+    def close(self):
+        """
+        Finalizes the animation file.
+        """
+        self.writer.finish()
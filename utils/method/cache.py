@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+class WorkerDurationCache:
+    def __init__(self, compute, maxsize=100_000):
+        """
+        Bounded LRU cache of per-worker processing durations.
+
+        Entries are keyed on the canonical signature (worker, frozenset of the assigned jobs),
+        so the same set of jobs on the same worker is only simulated once, whatever the
+        order in which the jobs appear in a path.
+
+        :param compute: Function (jobs, worker, *options) returning the duration of the worker.
+        :param maxsize: Maximum number of entries kept before the least recently used is dropped.
+        """
+        self.compute = compute
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, jobs, worker, *options):
+        key = (worker, frozenset(jobs), options)
+        duration = self.entries.get(key)
+        if duration is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return duration
+
+        self.misses += 1
+        duration = self.compute(jobs, worker, *options)
+        self.entries[key] = duration
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)  # Drop the least recently used entry
+        return duration
+
+    def resize(self, maxsize):
+        """
+        Changes the maximum number of entries, dropping the least recently used ones if needed.
+        """
+        self.maxsize = maxsize
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drops all entries and resets the hit/miss counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Returns the hit/miss counters of the cache as a dictionary.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.entries),
+            'maxsize': self.maxsize
+        }
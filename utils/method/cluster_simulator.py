@@ -0,0 +1,169 @@
+import heapq
+import bisect
+from collections import namedtuple
+
+# One job of a worker timeline: it runs from start to end, its result is back on the master at done
+TimelineEntry = namedtuple('TimelineEntry', ['job', 'start', 'end', 'done'])
+
+# Event kinds, in processing order when they happen at the same time
+COMPLETION = 0
+RELEASE = 1
+
+
+class SimulationResult:
+    def __init__(self, makespan, timelines, utilization):
+        """
+        Outcome of a ClusterSimulator run.
+
+        :param makespan: Time at which the last result is back on the master.
+        :param timelines: Dictionary worker name -> list of TimelineEntry, in start order.
+        :param utilization: Dictionary worker name -> {'busy', 'cores', 'memory', 'disk'}: fraction of the
+                            makespan during which the worker runs a job, and time-averaged fraction of its
+                            cores, memory and disk in use.
+        """
+        self.makespan = makespan
+        self.timelines = timelines
+        self.utilization = utilization
+
+    def worker_finish_times(self):
+        """
+        Returns the time at which each worker is done (0 for idle workers).
+        """
+        return {name: max((entry.done for entry in timeline), default=0.0) for name, timeline in self.timelines.items()}
+
+    def report(self):
+        """
+        Returns the timelines and utilization as a readable text table.
+        """
+        lines = [f"Makespan: {self.makespan:.1f}"]
+        for name, timeline in self.timelines.items():
+            usage = self.utilization[name]
+            lines.append(f"{name}: {len(timeline)} jobs, busy {100 * usage['busy']:.1f} %, cores {100 * usage['cores']:.1f} %, "
+                         f"memory {100 * usage['memory']:.1f} %, disk {100 * usage['disk']:.1f} %")
+            for entry in timeline:
+                lines.append(f"  {entry.start:>10.1f} -> {entry.end:>10.1f}  {entry.job.name}")
+        return "\n".join(lines)
+
+
+class ClusterSimulator:
+    def __init__(self, workers, capacity_aware=True, transfer_costs=None):
+        """
+        Virtual-clock, discrete-event replay of an assignment over the workers.
+
+        Instead of running each job in a thread that sleeps for its duration (Worker.execute_job),
+        the simulator advances a virtual clock from event to event (images arriving on a worker,
+        jobs completing), so a whole schedule is replayed in milliseconds. A worker starts its
+        waiting jobs in order of increasing duration as soon as they fit in the memory, disk and
+        cores left, the policy of calculate_worker_duration; with the same settings the replay
+        finds the makespan computed by the solver.
+
+        :param workers: List of workers (Worker or WorkerRecord objects).
+        :param capacity_aware: Enforce the real number of cores of the workers (False uses the historical 20 cores of the solver).
+        :param transfer_costs: TransferCosts of the instance: jobs start once their Docker image is on the worker
+                               and results are uploaded back to the master. None to replay compute time only.
+        """
+        self.workers = workers
+        self.capacity_aware = capacity_aware
+        self.transfer_costs = transfer_costs
+
+    def capacity(self, worker):
+        """
+        Returns the (memory, disk, cores) of a worker.
+        """
+        cores = worker.cpu_info.number_of_cores if self.capacity_aware else 20
+        return worker.available_memory_size, worker.available_disk_size, cores
+
+    def run(self, path):
+        """
+        Replays an assignment.
+
+        :param path: List of (job, worker) pairs, e.g. the optimal path returned by a solver.
+        :return: A SimulationResult.
+        :raises ValueError: If a job has no duration on its worker or can never fit in the worker's resources.
+        """
+        index = {worker: w for w, worker in enumerate(self.workers)}
+        assigned = [[] for _ in self.workers]
+        for job, worker in path:
+            if worker.name not in job.standard_processing_durations:
+                raise ValueError(f"Job {job.name} has no processing duration on {worker.name}.")
+            assigned[index[worker]].append(job)
+
+        available = [list(self.capacity(worker)) for worker in self.workers]
+        pending = [[] for _ in self.workers]  # Waiting jobs of each worker, as (duration, order, job, upload)
+        running = [0] * len(self.workers)
+        timelines = [[] for _ in self.workers]
+        events = []  # Min-heap of (time, kind, sequence, worker index, payload)
+        sequence = 0
+
+        for w, (worker, jobs) in enumerate(zip(self.workers, assigned)):
+            if self.transfer_costs is None:
+                releases = [(0.0, 0.0)] * len(jobs)
+            else:
+                releases = self.transfer_costs.release_times(jobs, worker)
+            for order, (job, (release, upload)) in enumerate(zip(jobs, releases)):
+                waiting = (job.standard_processing_durations[worker.name], order, job, upload)
+                heapq.heappush(events, (release, RELEASE, sequence, w, waiting))
+                sequence += 1
+
+        while events:
+            now = events[0][0]
+            touched = set()
+            # Apply every event happening now before starting jobs
+            while events and events[0][0] == now:
+                _, kind, _, w, payload = heapq.heappop(events)
+                if kind == COMPLETION:
+                    memory, disk, cores = payload
+                    available[w][0] += memory
+                    available[w][1] += disk
+                    available[w][2] += cores
+                    running[w] -= 1
+                else:
+                    bisect.insort(pending[w], payload, key=lambda waiting: waiting[:2])
+                touched.add(w)
+
+            for w in touched:
+                worker = self.workers[w]
+                waiting_jobs = []
+                for duration, order, job, upload in pending[w]:
+                    memory, disk, cores = job.required_memory_size_for_execution, job.required_disk_size_for_execution, job.thread_process_count
+                    if available[w][0] >= memory and available[w][1] >= disk and available[w][2] >= cores:
+                        available[w][0] -= memory
+                        available[w][1] -= disk
+                        available[w][2] -= cores
+                        running[w] += 1
+                        timelines[w].append(TimelineEntry(job, now, now + duration, now + duration + upload))
+                        heapq.heappush(events, (now + duration, COMPLETION, sequence, w, (memory, disk, cores)))
+                        sequence += 1
+                    else:
+                        waiting_jobs.append((duration, order, job, upload))
+                pending[w] = waiting_jobs
+                if pending[w] and not running[w] and not any(event[3] == w for event in events):
+                    raise ValueError(f"Worker {worker.name} can never fit the remaining {len(pending[w])} job(s) in its resources.")
+
+        makespan = max((entry.done for timeline in timelines for entry in timeline), default=0.0)
+        utilization = {worker.name: self._utilization(worker, timeline, makespan) for worker, timeline in zip(self.workers, timelines)}
+        return SimulationResult(makespan, {worker.name: timeline for worker, timeline in zip(self.workers, timelines)}, utilization)
+
+    def _utilization(self, worker, timeline, makespan):
+        memory, disk, cores = self.capacity(worker)
+        if not makespan:
+            return {'busy': 0.0, 'cores': 0.0, 'memory': 0.0, 'disk': 0.0}
+        # Busy time: union of the running intervals
+        busy = 0.0
+        busy_until = 0.0
+        for entry in sorted(timeline, key=lambda entry: entry.start):
+            if entry.end > busy_until:
+                busy += entry.end - max(entry.start, busy_until)
+                busy_until = entry.end
+        used = [0.0, 0.0, 0.0]
+        for entry in timeline:
+            duration = entry.end - entry.start
+            used[0] += duration * entry.job.thread_process_count
+            used[1] += duration * entry.job.required_memory_size_for_execution
+            used[2] += duration * entry.job.required_disk_size_for_execution
+        return {
+            'busy': busy / makespan,
+            'cores': used[0] / (cores * makespan) if cores else 0.0,
+            'memory': used[1] / (memory * makespan) if memory else 0.0,
+            'disk': used[2] / (disk * makespan) if disk else 0.0
+        }
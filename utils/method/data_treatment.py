@@ -1,47 +1,172 @@
 import re
+import string
+import numpy as np
+import pandas as pd
 from datetime import datetime
 from models.job import Job
 from models.worker import Worker
 from models.cpu import CPU
-from models.match import Match
+from models.records import JobRecord, WorkerRecord, CPURecord
+from models.match import Match, MatchTable
 
-def create_jobs_from_df(df):
-    jobs = []
-    
-    for index, row in df.iterrows():
-        # Parse the processing durations for each PC
-        standard_processing_durations = {
-            'PC1': parse_time_to_seconds(row['Standard Processing Duration PC1']),
-            'PC2': parse_time_to_seconds(row['Standard Processing Duration PC2']),
-            'PC3': parse_time_to_seconds(row['Standard Processing Duration PC3']),
-            'PC4': parse_time_to_seconds(row['Standard Processing Duration PC4']),
-            'PC5': parse_time_to_seconds(row['Standard Processing Duration PC5']),
-            'PC6': parse_time_to_seconds(row['Standard Processing Duration PC6']),
-        }
-
-        # Convert memory, disk sizes, and other attributes
-        required_memory_size = parse_size(row['Required Memory Size For Execution'])
-        required_disk_size = parse_size(row['Required Disk Size For Execution'])
-        docker_file_size = parse_size(row['Docker File Size'])
-        estimated_result_file_size = parse_size(row['Estimated Result File Size'])
-        docker_file_gen_duration = parse_time_to_seconds(row['Docker File Generation Duration On Master PC'])
-
-        # Create a Job object with the parsed values
-        job = Job(
-            ID = index,
-            name=row['Job Name'],
-            standard_processing_durations=standard_processing_durations,
-            required_memory_size_for_execution=required_memory_size,
-            required_disk_size_for_execution=required_disk_size,
-            docker_file_size=docker_file_size,
-            estimated_result_file_size=estimated_result_file_size,
-            docker_file_generation_duration_on_master_pc=docker_file_gen_duration,
-            thread_process_count=int(row['Thread Process Count'])
-        )
-        
-        jobs.append(job)
-    
-    return jobs
+DURATION_COLUMN_PREFIX = 'Standard Processing Duration '
+RATIO_COLUMN_PREFIX = 'Processing Time Ratio To '
+SIZE_UNITS = {'gb': 1024 * 1024 * 1024, 'mb': 1024 * 1024, 'kb': 1024, 'b': 1}
+FREQUENCY_UNITS = {'ghz': 1_000_000_000, 'mhz': 1_000_000, 'khz': 1_000, 'hz': 1}
+NUMBER_DELETIONS = str.maketrans('', '', string.ascii_lowercase + ' \t')
+UNIT_DELETIONS = str.maketrans('', '', string.digits + '. \t')
+
+def create_jobs_from_df(df, worker_table=None, derive_missing=False):
+    """
+    Creates the jobs of a jobs DataFrame.
+
+    :param df: DataFrame read from a jobs CSV file.
+    :param worker_table: Table created by worker_table_from_df. When given, the durations are read
+                         for the workers of the table, otherwise for every duration column of the file.
+    :param derive_missing: Fill the durations missing from the file with the Processing Time Ratio
+                           columns of the worker table.
+    """
+    table = job_table_from_df(df, None if worker_table is None else worker_table['name'].tolist())
+    if derive_missing and worker_table is not None:
+        table['durations'] = derive_missing_durations(table['durations'], worker_table)
+    return create_jobs_from_table(table)
+
+def job_table_from_df(df, worker_names=None):
+    """
+    Parses a jobs DataFrame column by column into a compact table of arrays.
+
+    All the HH:mm:ss and size columns are parsed with vectorized string operations
+    instead of converting every cell with parse_time_to_seconds and parse_size.
+
+    :param df: DataFrame read from a jobs CSV file.
+    :param worker_names: Names of the workers whose 'Standard Processing Duration <name>' columns are
+                         read, in order. Defaults to every such column of the file.
+    :return: Dictionary of columns: 'ID', 'name', 'pcs' (list of worker names), 'durations'
+             (jobs x workers float array, in seconds, NaN where the file has no duration),
+             'memory', 'disk', 'docker_file_size', 'result_file_size' (float arrays, in bytes),
+             'docker_gen_duration' (float array, in seconds) and 'threads' (int array).
+    """
+    if worker_names is None:
+        worker_names = [column[len(DURATION_COLUMN_PREFIX):] for column in df.columns if column.startswith(DURATION_COLUMN_PREFIX)]
+    known = [name for name in worker_names if DURATION_COLUMN_PREFIX + name in df.columns]
+
+    durations = np.full((len(df), len(worker_names)), np.nan)
+    if known:
+        durations[:, [worker_names.index(name) for name in known]] = parse_times(df[[DURATION_COLUMN_PREFIX + name for name in known]])
+    sizes = parse_sizes(df[['Required Memory Size For Execution',
+                            'Required Disk Size For Execution',
+                            'Docker File Size',
+                            'Estimated Result File Size']])
+    return {
+        'ID': df.index.to_numpy(),
+        'name': df['Job Name'].to_numpy(dtype=object),
+        'pcs': list(worker_names),
+        'durations': durations,
+        'memory': sizes[:, 0],
+        'disk': sizes[:, 1],
+        'docker_file_size': sizes[:, 2],
+        'result_file_size': sizes[:, 3],
+        'docker_gen_duration': parse_times(df['Docker File Generation Duration On Master PC']),
+        'threads': df['Thread Process Count'].to_numpy(dtype=np.int64),
+    }
+
+def derive_missing_durations(durations, worker_table):
+    """
+    Estimates the missing durations from the Processing Time Ratio To <reference> columns of the workers.
+
+    The duration of a job on a worker is its ratio to a reference worker times the duration of the
+    job on that reference; the estimates of all the references with a known duration are averaged.
+
+    :param durations: Jobs x workers float array (NaN for missing durations), columns in worker table order.
+    :param worker_table: Table created by worker_table_from_df.
+    :return: A copy of the array with the missing durations filled where possible.
+    """
+    durations = durations.copy()
+    names = worker_table['name'].tolist()
+    references = [r for r, reference in enumerate(worker_table['ratio_references']) if reference in names]
+    reference_columns = [names.index(worker_table['ratio_references'][r]) for r in references]
+
+    for w in np.flatnonzero(np.isnan(durations).any(axis=0)):
+        estimates = durations[:, reference_columns] * worker_table['ratios'][w, references]
+        known = ~np.isnan(estimates)
+        count = known.sum(axis=1)
+        mean = np.where(known, estimates, 0.0).sum(axis=1) / np.maximum(count, 1)
+        missing = np.isnan(durations[:, w]) & (count > 0)
+        durations[missing, w] = mean[missing]
+    return durations
+
+def create_duration_matrix(jobs, workers):
+    """
+    Builds the dense jobs x workers float array of processing durations (inf where a job has no duration on a worker).
+    """
+    return np.array([[job.standard_processing_durations.get(worker.name, np.inf) for worker in workers] for job in jobs], dtype=float)
+
+def create_jobs_from_table(table, records=False):
+    """
+    Builds Job objects, or JobRecord objects if records is set, from a table created by job_table_from_df.
+    """
+    pcs = table['pcs']
+    job_class = JobRecord if records else Job
+    return [job_class(ID=ID,
+                      name=name,
+                      standard_processing_durations={pc: duration for pc, duration in zip(pcs, durations) if duration == duration},  # Skip NaN
+                      required_memory_size_for_execution=memory,
+                      required_disk_size_for_execution=disk,
+                      docker_file_size=docker_file_size,
+                      estimated_result_file_size=result_file_size,
+                      docker_file_generation_duration_on_master_pc=docker_gen_duration,
+                      thread_process_count=threads)
+            for ID, name, durations, memory, disk, docker_file_size, result_file_size, docker_gen_duration, threads
+            in zip(table['ID'].tolist(),
+                   table['name'].tolist(),
+                   table['durations'].tolist(),
+                   table['memory'].tolist(),
+                   table['disk'].tolist(),
+                   table['docker_file_size'].tolist(),
+                   table['result_file_size'].tolist(),
+                   table['docker_gen_duration'].tolist(),
+                   table['threads'].tolist())]
+
+def parse_times(columns):
+    """
+    Vectorized parse_time_to_seconds over one or several HH:mm:ss columns.
+
+    :param columns: Series or DataFrame of time strings.
+    :return: Float array of seconds with the shape of the input, NaN for empty cells.
+    """
+    cells = np.array(columns, dtype=object).ravel()
+    empty = pd.isna(cells)
+    cells[empty] = "0:0:0"
+    # Parse all the cells at once: "02:14:46,00:39:40" -> [2, 14, 46, 0, 39, 40]
+    text = ",".join(map(str, cells.tolist())).replace(":", ",")
+    parts = np.fromstring(text, sep=",", dtype=np.int64).reshape(-1, 3)
+    seconds = (parts[:, 0] * 3600 + parts[:, 1] * 60 + parts[:, 2]).astype(float)
+    seconds[empty] = np.nan
+    return seconds.reshape(np.shape(columns))
+
+def parse_sizes(columns, unitless=0.0):
+    """
+    Vectorized parse_size / convert_to_bytes over one or several size columns (e.g. "1.5GB", "17KB", "100MB/s").
+
+    :param columns: Series or DataFrame of size strings.
+    :param unitless: Multiplier of values without unit (0.0 as parse_size, 1.0 as convert_to_bytes).
+    :return: Float array of bytes with the shape of the input.
+    """
+    return parse_quantities(columns, SIZE_UNITS, unitless)
+
+def parse_frequencies(columns):
+    """
+    Vectorized convert_to_hz over one or several clock rate columns (e.g. "1.70GHz").
+    """
+    return parse_quantities(columns, FREQUENCY_UNITS, 1.0)
+
+def parse_quantities(columns, units, unitless):
+    # Strip the units and the numbers from the whole block of cells with two str.translate calls
+    text = "\n".join(map(str, np.asarray(columns, dtype=object).ravel().tolist())).lower().replace("/s", "")
+    numbers = text.translate(NUMBER_DELETIONS).replace("\n", ",")
+    values = np.fromstring(numbers, sep=",", dtype=float)
+    multipliers = np.array([units.get(unit, unitless) for unit in text.translate(UNIT_DELETIONS).split("\n")])
+    return (values * multipliers).reshape(np.shape(columns))
 
 # Helper function to parse sizes (e.g., GB, MB, KB) to bytes
 def parse_size(size_str):
@@ -62,36 +187,89 @@ def parse_time_to_seconds(time_str):
     return time_parts[0] * 3600 + time_parts[1] * 60 + time_parts[2]
 
 def create_workers_from_df(df):
-    # List to store Worker objects
+    return create_workers_from_table(worker_table_from_df(df))
+
+def worker_table_from_df(df):
+    """
+    Parses a workers DataFrame column by column into a compact table of arrays.
+
+    :param df: DataFrame read from a workers CSV file.
+    :return: Dictionary of columns: 'ID', 'name', 'cores', 'clock_rate' (in Hz), 'family_name',
+             'denomination', 'memory', 'disk', 'bandwidth' (in bytes), 'delay' (in seconds),
+             'ratio_references' (names of the Processing Time Ratio To <name> columns) and
+             'ratios' (workers x references float array).
+    """
+    references = [column[len(RATIO_COLUMN_PREFIX):] for column in df.columns if column.startswith(RATIO_COLUMN_PREFIX)]
+    return {
+        'ID': df.index.to_numpy(),
+        'name': df['Worker PC Name'].str.strip().to_numpy(dtype=object),
+        'cores': df['Available CPU Core Number'].to_numpy(dtype=np.int64),
+        'clock_rate': parse_frequencies(df['CPU Clock Rate']),
+        'family_name': df['CPU Family Name'].str.strip().to_numpy(dtype=object),
+        'denomination': df['CPU Denomination'].str.strip().to_numpy(dtype=object),
+        'memory': parse_sizes(df['Available Memory Size'], unitless=1.0),
+        'disk': parse_sizes(df['Available Disk Size'], unitless=1.0),
+        'bandwidth': parse_sizes(df['Connection Bandwidth With Master PC'], unitless=1.0),
+        # Delays may be HH:MM:SS or plain seconds, and there is only one per worker
+        'delay': np.array([convert_to_seconds(value) for value in df['Connection Delay With Master PC']], dtype=float),
+        'ratio_references': references,
+        'ratios': df[[RATIO_COLUMN_PREFIX + reference for reference in references]].to_numpy(dtype=float),
+    }
+
+def create_workers_from_table(table, records=False):
+    """
+    Builds Worker objects, or WorkerRecord objects if records is set, from a table created by worker_table_from_df.
+    """
     workers = []
-    
-    for index, row in df.iterrows():
-        # Create a new CPU object
-        cpu_info = CPU(
-            number_of_cores=int(row['Available CPU Core Number']),
-            clock_rate_in_hz=convert_to_hz(row['CPU Clock Rate']),
-            family_name=row['CPU Family Name'].strip(),
-            denomination=row['CPU Denomination'].strip()
-        )
-    
-        # Create a new Worker object
-        worker = Worker(
-            ID=index,
-            cpu_info=cpu_info,
-            available_memory_size=convert_to_bytes(row['Available Memory Size']),
-            available_disk_size=convert_to_bytes(row['Available Disk Size']),
-            connection_bandwidth_with_master_pc=convert_to_bytes(row['Connection Bandwidth With Master PC']),
-            connection_delay_with_master_pc=convert_to_seconds(row['Connection Delay With Master PC']),
-            name=row['Worker PC Name'].strip(),
-            cpu_usage_in_percentage=0.0,
-            current_global_cpu_time=0.0
-        )
-    
-        # Add the worker to the list
-        workers.append(worker)
-        
+    for ID, name, cores, clock_rate, family_name, denomination, memory, disk, bandwidth, delay in zip(
+            table['ID'].tolist(), table['name'].tolist(), table['cores'].tolist(), table['clock_rate'].tolist(),
+            table['family_name'].tolist(), table['denomination'].tolist(), table['memory'].tolist(),
+            table['disk'].tolist(), table['bandwidth'].tolist(), table['delay'].tolist()):
+        if records:
+            workers.append(WorkerRecord(ID=ID,
+                                        name=name,
+                                        cpu_info=CPURecord(cores, clock_rate, family_name, denomination),
+                                        available_memory_size=memory,
+                                        available_disk_size=disk,
+                                        connection_bandwidth_with_master_pc=bandwidth,
+                                        connection_delay_with_master_pc=delay))
+        else:
+            workers.append(Worker(ID=ID,
+                                  cpu_info=CPU(number_of_cores=cores, clock_rate_in_hz=clock_rate, family_name=family_name, denomination=denomination),
+                                  available_memory_size=memory,
+                                  available_disk_size=disk,
+                                  connection_bandwidth_with_master_pc=bandwidth,
+                                  connection_delay_with_master_pc=delay,
+                                  name=name,
+                                  cpu_usage_in_percentage=0.0,
+                                  current_global_cpu_time=0.0))
     return workers
-    
+
+def create_job_records(jobs):
+    """
+    Converts jobs (Job or JobRecord objects) into JobRecord objects, e.g. to ship them to a process pool.
+    """
+    return [JobRecord.from_job(job) for job in jobs]
+
+def create_worker_records(workers):
+    """
+    Converts workers (Worker or WorkerRecord objects) into WorkerRecord objects.
+    """
+    return [WorkerRecord.from_worker(worker) for worker in workers]
+
+def instance_key(jobs, workers):
+    """
+    Content signature of a problem instance: two requests with equal jobs and workers get the same key.
+    """
+    job_key = tuple((job.name, tuple(sorted(job.standard_processing_durations.items())),
+                     job.required_memory_size_for_execution, job.required_disk_size_for_execution,
+                     job.thread_process_count, job.docker_file_size, job.estimated_result_file_size,
+                     job.docker_file_generation_duration_on_master_pc) for job in jobs)
+    worker_key = tuple((worker.name, worker.cpu_info.number_of_cores, worker.available_memory_size,
+                        worker.available_disk_size, worker.connection_bandwidth_with_master_pc,
+                        worker.connection_delay_with_master_pc) for worker in workers)
+    return job_key, worker_key
+
 # Function to convert CPU clock rate from various formats to Hz
 def convert_to_hz(value):
     value = value.lower().strip()
@@ -142,11 +320,59 @@ def convert_to_seconds(value):
 #                 if VERBOSE:
 #                     print(f"{job.name} {worker.name} not possible")
 #     return matches
-def create_matches(jobs,workers,pheromone,VERBOSE = 0):
-    #list to create matches
-    matches = []
-    for job in jobs: 
-        for worker in workers:
-            match = Match(value=(job,worker),pheromone=pheromone)
-            matches.append(match)
+def create_matches(jobs,workers,pheromone,VERBOSE = 0,durations=None,capacity_aware=False):
+    #table of matches, indexed per job and per (job, worker)
+    #durations: optional dense jobs x workers array (see create_duration_matrix), pairs without duration are skipped
+    #capacity_aware: also skip the pairs where the worker cannot handle the job (see create_feasibility_mask)
+    if durations is None:
+        durations = create_duration_matrix(jobs, workers)
+    if capacity_aware:
+        feasible = create_feasibility_mask(jobs, workers)
+        unassignable = np.flatnonzero(~feasible.any(axis=1))
+        if len(unassignable):
+            raise ValueError(f"Job {jobs[unassignable[0]].name} cannot be handled by any worker.")
+        durations = np.where(feasible, durations, np.inf)
+    matches = MatchTable(jobs, workers)
+    for job, row in zip(jobs, durations.tolist()):
+        for worker, duration in zip(workers, row):
+            if duration == float('inf'):
+                if VERBOSE:
+                    print(f"{job.name} {worker.name} not possible")
+                continue
+            match = Match(value=(job,worker),pheromone=pheromone,processing_duration=duration)
+            matches.add(match)
     return matches
+
+def create_feasibility_mask(jobs, workers):
+    """
+    Computes Worker.can_handle_job for every job-worker pair at once.
+
+    :param jobs: List of jobs.
+    :param workers: List of workers.
+    :return: Boolean array of shape (len(jobs), len(workers)), True where the worker has enough
+             memory, disk and cores for the job.
+    """
+    job_needs = np.array([(job.required_memory_size_for_execution,
+                           job.required_disk_size_for_execution,
+                           job.thread_process_count) for job in jobs], dtype=float).reshape(-1, 3)
+    capacities = np.array([(worker.available_memory_size,
+                            worker.available_disk_size,
+                            worker.cpu_info.number_of_cores) for worker in workers], dtype=float).reshape(-1, 3)
+    return (job_needs[:, np.newaxis, :] <= capacities[np.newaxis, :, :]).all(axis=2)
+
+def create_matrices(jobs, workers, matches):
+    """
+    Builds dense jobs x workers arrays from a table of matches.
+
+    :param jobs: List of jobs (rows of the arrays).
+    :param workers: List of workers (columns of the arrays).
+    :param matches: MatchTable of the jobs and workers.
+    :return: A tuple (pheromone, duration) of float arrays of shape (len(jobs), len(workers)),
+             with a pheromone of 0 and an infinite duration for the pairs without match.
+    """
+    pheromone = np.zeros((len(jobs), len(workers)))
+    duration = np.full((len(jobs), len(workers)), np.inf)
+    for (j, w), match in matches.cells.items():
+        pheromone[j, w] = match.pheromone
+        duration[j, w] = match.processing_duration
+    return pheromone, duration
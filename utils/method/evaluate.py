@@ -1,11 +1,11 @@
-from utils.method.pheromone_update import calculate_worker_duration
+from utils.method.pheromone_update import worker_duration_cache, max_worker_processing_duration
 
 def evaluate(jobs, matches):
     """
     Evaluates the matches to determine the optimal path with the minimum processing duration.
     
     :param jobs: List of jobs.
-    :param matches: List of Match objects (job-worker pairs with pheromone and processing duration).
+    :param matches: MatchTable of Match objects (job-worker pairs with pheromone and processing duration).
     :return: A tuple containing the optimal path and the total processing duration.
              The optimal path is a list of tuples (job, worker), and the total duration is an integer.
     """
@@ -14,8 +14,8 @@ def evaluate(jobs, matches):
 
     # Build the optimal path by selecting the match with the highest pheromone level for each job
     for job in jobs:
-        # Filter matches that correspond to the current job
-        job_matches = [match for match in matches if match.value[0] == job]
+        # Matches that correspond to the current job
+        job_matches = matches.job_matches(job)
 
         # Select the match with the highest pheromone level (most likely assignment)
         best_match = max(job_matches, key=lambda m: m.pheromone)
@@ -32,11 +32,23 @@ def evaluate(jobs, matches):
     # Calculate the total processing duration based on the max worker processing duration
     total_processing_duration = 0
     for worker, assigned_jobs in worker_jobs.items():
-        worker_duration = calculate_worker_duration(assigned_jobs, worker)
+        worker_duration = worker_duration_cache(assigned_jobs, worker)
         total_processing_duration = max(total_processing_duration, worker_duration)
 
     return optimal_path, total_processing_duration
-    
+
+def evaluate_matrix(jobs, workers, pheromone):
+    """
+    Array form of evaluate: picks the worker with the highest pheromone level for each job.
+
+    :param jobs: List of jobs (rows of the pheromone array).
+    :param workers: List of workers (columns of the pheromone array).
+    :param pheromone: Array (jobs x workers) of pheromone levels.
+    :return: A tuple containing the optimal path and the total processing duration.
+    """
+    optimal_path = [(job, workers[w]) for job, w in zip(jobs, pheromone.argmax(axis=1))]
+    return optimal_path, max_worker_processing_duration(optimal_path)
+
 def format_duration(seconds):
     """
     Converts a duration from seconds to a string in the format of hours, minutes, and seconds.
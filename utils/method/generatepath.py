@@ -1,12 +1,25 @@
-import random
+import numpy as np
+from utils.method.random_streams import make_rng
 
-def generate_paths(ants, jobs, matches, alpha, beta):
+def generate_paths(ants, jobs, matches, alpha, beta, rng=None):
+    """
+    Builds a path (one worker per job) for each ant.
+
+    :param rng: Seed or numpy Generator used by the ants that have no stream of their own.
+    """
+    fallback = None
     for ant in ants:
         ant.path = []
-        for job in jobs:
-            matching_elements = [match for match in matches if match.value[0] == job]
+        if ant.rng is not None:
+            stream = ant.rng
+        else:
+            if fallback is None:
+                fallback = make_rng(rng)  # Only built when an ant has no stream of its own
+            stream = fallback
+        draws = stream.random(len(jobs)).tolist()
+        for job, r in zip(jobs, draws):
+            matching_elements = matches.job_matches(job)
             p = calculate_probabilities(matching_elements, alpha, beta)  # calculate probabilities (worker, probability)
-            r = random.random()
             w = pick_worker(r, p)
             ant.path.append((job, w))  # append job-worker pair to the ant's path
     return ants
@@ -56,3 +69,25 @@ def pick_worker(random_value, worker_probabilities):
             return worker  # Return the exact worker when the random value falls within the cumulative probability
 
     return worker_probabilities[-1][0]  # Fallback to return the last worker in case of rounding issues
+
+def generate_assignments(pheromone, eta, num_ants, alpha, beta, rng):
+    """
+    Samples the full assignment of every ant in one batched operation.
+
+    :param pheromone: Array (jobs x workers) of pheromone levels.
+    :param eta: Array (jobs x workers) of heuristic values (inverse of the processing durations).
+    :param num_ants: Number of ants (assignments) to sample.
+    :param alpha: Weight for pheromone importance.
+    :param beta: Weight for processing duration (distance) importance.
+    :param rng: numpy Generator used for the uniform draws.
+    :return: Integer array (ants x jobs) holding the index of the worker chosen for each job.
+    """
+    # Desirability formula: τ_ik^α * η_ik^β, accumulated along the workers axis
+    cumulative = np.cumsum((pheromone ** alpha) * (eta ** beta), axis=1)
+
+    # One uniform draw per (ant, job), scaled to the total desirability of the job
+    draws = rng.random((num_ants, pheromone.shape[0])) * cumulative[:, -1]
+
+    # The chosen worker is the first one whose cumulative desirability reaches the draw
+    choices = (cumulative[np.newaxis, :, :] < draws[:, :, np.newaxis]).sum(axis=2)
+    return np.minimum(choices, pheromone.shape[1] - 1)  # Fallback to the last worker in case of rounding issues
@@ -0,0 +1,112 @@
+from utils.options import capacity_aware
+from utils.method.pheromone_update import worker_duration_cache
+
+class IncrementalEvaluator:
+    def __init__(self, path, capacity_aware=capacity_aware):
+        """
+        Holds the per-worker loads and durations of a path so that moving or swapping jobs
+        only re-simulates the two workers involved.
+
+        :param path: A list of tuples (job, worker).
+        :param capacity_aware: Refuse the moves to workers that cannot handle the job, the rule of
+                               create_matches(..., capacity_aware=True).
+        """
+        self.capacity_aware = capacity_aware
+        self.jobs = [job for job, _ in path]
+        self.order = {job: i for i, job in enumerate(self.jobs)}
+        self.assignment = {}  # job -> worker
+        self.worker_jobs = {}  # worker -> list of jobs
+        for job, worker in path:
+            self.assignment[job] = worker
+            self.worker_jobs.setdefault(worker, []).append(job)
+
+        self.durations = {worker: worker_duration_cache(jobs, worker) for worker, jobs in self.worker_jobs.items()}
+        self.makespan = max(self.durations.values(), default=0)
+
+    def allows(self, job, worker):
+        """
+        Checks whether the job can be given to the worker: it has a duration there and, in capacity-aware mode, fits in its resources.
+        """
+        if worker.name not in job.standard_processing_durations:
+            return False
+        return not self.capacity_aware or worker.can_handle_job(job)
+
+    def move(self, job, from_worker, to_worker):
+        """
+        Moves a job from one worker to another.
+
+        :param job: The job to move.
+        :param from_worker: The worker the job is currently assigned to.
+        :param to_worker: The worker receiving the job.
+        :return: The new makespan (unchanged if the worker cannot take the job, see allows).
+        """
+        if self.assignment[job] is not from_worker:
+            raise ValueError(f"Job {job.name} is not assigned to worker {from_worker.name}.")
+        if from_worker is to_worker or not self.allows(job, to_worker):
+            return self.makespan
+
+        self.worker_jobs[from_worker].remove(job)
+        self.worker_jobs.setdefault(to_worker, []).append(job)
+        self.assignment[job] = to_worker
+        return self._refresh(from_worker, to_worker)
+
+    def swap(self, a, b):
+        """
+        Exchanges the workers of two jobs.
+
+        :param a: First job.
+        :param b: Second job.
+        :return: The new makespan (unchanged if a worker cannot take its new job, see allows).
+        """
+        worker_a, worker_b = self.assignment[a], self.assignment[b]
+        if worker_a is worker_b or not self.allows(a, worker_b) or not self.allows(b, worker_a):
+            return self.makespan
+
+        jobs_a, jobs_b = self.worker_jobs[worker_a], self.worker_jobs[worker_b]
+        jobs_a[jobs_a.index(a)] = b
+        jobs_b[jobs_b.index(b)] = a
+        self.assignment[a], self.assignment[b] = worker_b, worker_a
+        return self._refresh(worker_a, worker_b)
+
+    def path(self):
+        """
+        Returns the current assignment as a list of tuples (job, worker), in the original job order.
+        """
+        return [(job, self.assignment[job]) for job in self.jobs]
+
+    def _refresh(self, *workers):
+        # Re-simulate only the given workers (jobs kept in path order), then take the max over the stored durations
+        for worker in workers:
+            jobs = sorted(self.worker_jobs[worker], key=self.order.__getitem__)
+            self.durations[worker] = worker_duration_cache(jobs, worker)
+        self.makespan = max(self.durations.values())
+        return self.makespan
+
+
+def improve_path(path, workers, max_rounds=10, capacity_aware=capacity_aware):
+    """
+    First-improvement local search over single-job moves, evaluated incrementally.
+
+    :param path: A list of tuples (job, worker), for example the result of an ACO run.
+    :param workers: List of candidate workers.
+    :param max_rounds: Maximum number of passes over all jobs.
+    :param capacity_aware: Only try the workers that can handle the job (see IncrementalEvaluator).
+    :return: A tuple containing the improved path and its makespan.
+    """
+    evaluator = IncrementalEvaluator(path, capacity_aware)
+    for _ in range(max_rounds):
+        improved = False
+        for job in evaluator.jobs:
+            current_worker = evaluator.assignment[job]
+            for worker in workers:
+                if worker is current_worker or not evaluator.allows(job, worker):
+                    continue
+                before = evaluator.makespan
+                if evaluator.move(job, current_worker, worker) < before:
+                    current_worker = worker
+                    improved = True
+                else:
+                    evaluator.move(job, worker, current_worker)  # Undo the move
+        if not improved:
+            break
+    return evaluator.path(), evaluator.makespan
@@ -0,0 +1,184 @@
+import os
+import glob
+import json
+import time
+import shutil
+import numpy as np
+import pandas as pd
+from utils.method.data_treatment import job_table_from_df, worker_table_from_df, derive_missing_durations, create_jobs_from_table, create_workers_from_table
+
+# Columns of the job and worker tables stored as .npy files, the other ones go to names.json
+JOB_ARRAYS = ('ID', 'durations', 'memory', 'disk', 'docker_file_size', 'result_file_size', 'docker_gen_duration', 'threads')
+WORKER_ARRAYS = ('ID', 'cores', 'clock_rate', 'memory', 'disk', 'bandwidth', 'delay', 'ratios')
+FORMAT_VERSION = 1
+
+def instance_path(jobs_csv, workers_csv, cache_dir, derive_missing=False):
+    """
+    Returns the directory of the compiled instance of a pair of CSV files.
+    """
+    name = f"{os.path.splitext(os.path.basename(jobs_csv))[0]}-{os.path.splitext(os.path.basename(workers_csv))[0]}"
+    return os.path.join(cache_dir, name + ("-derived" if derive_missing else ""))
+
+def source_signature(*paths):
+    """
+    Identifies the current version of the source files by their path, size and modification time.
+    """
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+def compile_instance(jobs_csv, workers_csv, cache_dir, derive_missing=False):
+    """
+    Parses a pair of jobs/workers CSV files once and stores the resulting tables in a binary format:
+    one .npy file per numeric column and a names.json holding the strings and the source signature.
+
+    :param jobs_csv: Path of the jobs CSV file.
+    :param workers_csv: Path of the workers CSV file.
+    :param cache_dir: Directory holding the compiled instances.
+    :param derive_missing: Store the durations completed by derive_missing_durations.
+    :return: Path of the compiled instance directory.
+    """
+    path = instance_path(jobs_csv, workers_csv, cache_dir, derive_missing)
+    worker_table = worker_table_from_df(pd.read_csv(workers_csv))
+    job_table = job_table_from_df(pd.read_csv(jobs_csv), worker_table['name'].tolist())
+    if derive_missing:
+        job_table['durations'] = derive_missing_durations(job_table['durations'], worker_table)
+
+    # Every compilation writes a new version directory, published once complete (see publish_version)
+    version = f"{path}.v{time.time_ns()}-{os.getpid()}"
+    os.makedirs(version)
+    for key in JOB_ARRAYS:
+        np.save(os.path.join(version, f"job_{key}.npy"), np.ascontiguousarray(job_table[key]))
+    for key in WORKER_ARRAYS:
+        np.save(os.path.join(version, f"worker_{key}.npy"), np.ascontiguousarray(worker_table[key]))
+    names = {
+        'version': FORMAT_VERSION,
+        'sources': source_signature(jobs_csv, workers_csv),
+        'job_name': job_table['name'].tolist(),
+        'pcs': job_table['pcs'],
+        'worker_name': worker_table['name'].tolist(),
+        'family_name': worker_table['family_name'].tolist(),
+        'denomination': worker_table['denomination'].tolist(),
+        'ratio_references': worker_table['ratio_references'],
+    }
+    with open(os.path.join(version, "names.json"), "w") as f:
+        json.dump(names, f)
+
+    publish_version(version, path)
+    return path
+
+def publish_version(version, path):
+    """
+    Makes the instance path point to a complete version directory.
+
+    The path is a symbolic link swapped with os.replace, so a reader opens either the previous
+    instance or the new one, never a missing or partial directory. The previous version is kept
+    for the readers still opening it; older ones are removed. Where symbolic links cannot be
+    created, the previous directory is renamed aside before the new one takes its place.
+
+    :param version: Directory holding the new compiled instance.
+    :param path: Path of the compiled instance, as returned by instance_path.
+    """
+    previous = os.path.realpath(path) if os.path.islink(path) else None
+    link = f"{path}.link{os.getpid()}"
+    try:
+        if os.path.lexists(link):
+            os.remove(link)
+        os.symlink(os.path.basename(version), link)
+    except OSError:
+        aside = f"{path}.old{os.getpid()}"
+        if os.path.lexists(path):
+            os.replace(path, aside)
+        try:
+            os.replace(version, path)
+        except OSError:
+            shutil.rmtree(version, ignore_errors=True)  # Another process published the same instance first
+        shutil.rmtree(aside, ignore_errors=True)
+        return
+
+    if os.path.isdir(path) and not os.path.islink(path):
+        # Plain directory written by an earlier version of the cache
+        aside = f"{path}.old{os.getpid()}"
+        os.replace(path, aside)
+        os.replace(link, path)
+        shutil.rmtree(aside, ignore_errors=True)
+    else:
+        os.replace(link, path)
+
+    keep = {os.path.realpath(version), previous, os.path.realpath(path)}
+    for stale in glob.glob(f"{glob.escape(path)}.v*"):
+        if os.path.realpath(stale) not in keep:
+            shutil.rmtree(stale, ignore_errors=True)
+
+def is_stale(path, jobs_csv, workers_csv):
+    """
+    Checks whether a compiled instance is missing or older than its source CSV files.
+    """
+    try:
+        with open(os.path.join(path, "names.json")) as f:
+            names = json.load(f)
+    except (OSError, ValueError):
+        return True
+    return names.get('version') != FORMAT_VERSION or names.get('sources') != source_signature(jobs_csv, workers_csv)
+
+def ensure_instance(jobs_csv, workers_csv, cache_dir, derive_missing=False):
+    """
+    Returns the path of the compiled instance, (re)compiling it if the CSV files changed.
+    """
+    path = instance_path(jobs_csv, workers_csv, cache_dir, derive_missing)
+    if is_stale(path, jobs_csv, workers_csv):
+        path = compile_instance(jobs_csv, workers_csv, cache_dir, derive_missing)
+    return path
+
+def open_instance(path, mmap_mode='r'):
+    """
+    Opens a compiled instance without parsing anything.
+
+    The arrays are memory-mapped (read-only by default), so processes opening the same instance
+    share its pages through the operating system instead of holding copies.
+
+    :param path: Path of the compiled instance directory.
+    :param mmap_mode: Memory-map mode passed to numpy.load (None reads the arrays into memory).
+    :return: A tuple (job_table, worker_table) with the layout of job_table_from_df and worker_table_from_df.
+    """
+    with open(os.path.join(path, "names.json")) as f:
+        names = json.load(f)
+    job_table = {key: np.load(os.path.join(path, f"job_{key}.npy"), mmap_mode=mmap_mode) for key in JOB_ARRAYS}
+    worker_table = {key: np.load(os.path.join(path, f"worker_{key}.npy"), mmap_mode=mmap_mode) for key in WORKER_ARRAYS}
+    job_table['name'] = np.array(names['job_name'], dtype=object)
+    job_table['pcs'] = names['pcs']
+    worker_table['name'] = np.array(names['worker_name'], dtype=object)
+    worker_table['family_name'] = np.array(names['family_name'], dtype=object)
+    worker_table['denomination'] = np.array(names['denomination'], dtype=object)
+    worker_table['ratio_references'] = names['ratio_references']
+    return job_table, worker_table
+
+def load_instance(jobs_csv, workers_csv, cache_dir, derive_missing=False):
+    """
+    Loads the job and worker tables of a pair of CSV files through the compiled instance cache.
+
+    :return: A tuple (instance path, job_table, worker_table).
+    """
+    path = ensure_instance(jobs_csv, workers_csv, cache_dir, derive_missing)
+    return (path, *open_instance(path))
+
+def load_problem(jobs_csv, workers_csv, cache_dir=None, derive_missing=False, records=False):
+    """
+    Creates the jobs and workers of a pair of CSV files.
+
+    :param cache_dir: Directory of the compiled instances, None to parse the CSV files directly.
+    :param derive_missing: Fill the missing durations with derive_missing_durations.
+    :param records: Create JobRecord/WorkerRecord objects instead of Job/Worker objects.
+    :return: A tuple (instance path or None, jobs, workers).
+    """
+    if cache_dir:
+        instance, job_table, worker_table = load_instance(jobs_csv, workers_csv, cache_dir, derive_missing)
+    else:
+        instance = None
+        worker_table = worker_table_from_df(pd.read_csv(workers_csv))
+        job_table = job_table_from_df(pd.read_csv(jobs_csv), worker_table['name'].tolist())
+        if derive_missing:
+            job_table['durations'] = derive_missing_durations(job_table['durations'], worker_table)
+    return instance, create_jobs_from_table(job_table, records), create_workers_from_table(worker_table, records)
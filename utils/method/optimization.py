@@ -1,54 +1,141 @@
+import time
+import json
+import hashlib
 import numpy as np
 from tqdm import tqdm
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from models.ant import Ant
 from itertools import product
 # from algorithm.aco import ACO
 from algorithm.aco_elitist_minmax import ACO_elitist_minmax as ACO
-from utils.options import jobs 
-from random import uniform, choice
-from utils.method.data_treatment import create_matches
+from utils.options import jobs, capacity_aware, transfer_aware
+from utils.method.data_treatment import create_matches, create_job_records, create_worker_records, create_jobs_from_table, create_workers_from_table, instance_key
+from utils.method.instance_cache import open_instance
+from utils.method.pheromone_update import configure_worker_duration
+from utils.method.transfer_costs import TransferCosts
 from utils.method.evaluate import format_duration  # Add this import
+from utils.method.trial_store import TrialStore
+from utils.method.random_streams import make_rng, spawn_rngs
 
-def find_optimal_path(jobs, workers, num_ants=5, initial_pheromone=0.554, alpha=1.182, beta=0.497, evap_coeff=0.892, Q=75.021, iterations=10, verbose=0):
+def find_optimal_path(jobs, workers, num_ants=5, initial_pheromone=0.554, alpha=1.182, beta=0.497, evap_coeff=0.892, Q=75.021, iterations=10, verbose=0, n_workers=1, rng=None, max_iterations=100, tolerance=1e-5, patience=10, instance=None):
     """
     Executes the ACO function multiple times to find the best path with the lowest total duration.
     
     :param jobs: List of jobs.
-    :param matches: List of Match objects.
-    :param ants: List of Ant objects.
+    :param workers: List of workers.
+    :param num_ants: Number of ants per colony.
+    :param initial_pheromone: Initial pheromone level of the matches.
     :param alpha: Pheromone importance.
     :param beta: Heuristic importance.
     :param evap_coeff: Pheromone evaporation coefficient.
     :param Q: Constant for pheromone deposition.
     :param iterations: Number of times to run the ACO function.
+    :param n_workers: Number of processes running the independent restarts (1 runs them in this process).
+    :param rng: Seed or numpy Generator from which an independent stream is spawned for every restart (None for fresh entropy).
+    :param max_iterations: Maximum number of iterations of each ACO run.
+    :param tolerance: Convergence tolerance of each ACO run.
+    :param patience: Number of iterations without improvement before each ACO run stops.
+    :param instance: Path of the compiled instance of the jobs and workers (see instance_cache), memory-mapped
+                     by the pool processes instead of receiving a copy of the problem.
     :return: A tuple containing the optimal path, the lowest total duration found, and mean duration.
     """
     best_path = None
     lowest_duration = float('inf')
     all_durations = []
 
-    for i in range(iterations):
-        matches = create_matches(jobs,workers,initial_pheromone)    
-        ants = []
-        for j in range(1, num_ants + 1):
-            ants.append(Ant(id=j))
-        # Run the ACO algorithm
-        optimal_path, total_duration = ACO(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q)
-        
-        all_durations.append(total_duration)
-
-        # Check if the current run's duration is the lowest
-        if total_duration < lowest_duration:
-            lowest_duration = total_duration
-            best_path = optimal_path
-        if verbose:
-            print(f"Iteration {i+1}: Duration={total_duration}, Best Duration={lowest_duration}")
+    params = {
+        'num_ants': num_ants,
+        'initial_pheromone': initial_pheromone,
+        'alpha': alpha,
+        'beta': beta,
+        'evap_coeff': evap_coeff,
+        'Q': Q,
+        'max_iterations': max_iterations,
+        'tolerance': tolerance,
+        'patience': patience
+    }
+    streams = spawn_rngs(rng, iterations)
+
+    with ExitStack() as stack:
+        if n_workers > 1:
+            # Jobs and workers are shipped once per process, restarts only send their parameters and stream
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=n_workers,
+                                                               initializer=init_restart_worker,
+                                                               initargs=problem_initargs(jobs, workers, instance)))
+            outcomes = executor.map(run_restart_in_worker, [params] * iterations, streams)
+            runs = (([(jobs[j], workers[w]) for j, w in path], duration) for path, duration in outcomes)
+        else:
+            runs = (run_restart(jobs, workers, params, stream) for stream in streams)
+
+        for i, (optimal_path, total_duration) in enumerate(runs):
+            all_durations.append(total_duration)
+
+            # Check if the current run's duration is the lowest
+            if total_duration < lowest_duration:
+                lowest_duration = total_duration
+                best_path = optimal_path
+            if verbose:
+                print(f"Iteration {i+1}: Duration={total_duration}, Best Duration={lowest_duration}")
     
     mean_duration = sum(all_durations) / len(all_durations)
     return best_path, lowest_duration, mean_duration
 
+def restart_seeds(rng, count):
+    """
+    Derives independent, reproducible integer seeds (e.g. one per tuning trial) from a seed or Generator.
+    """
+    return [int(child.integers(2**63)) for child in spawn_rngs(rng, count)]
+
+def run_restart(jobs, workers, params, rng, capacity_aware=capacity_aware):
+    """
+    Runs one independent ACO colony.
 
-def fine_tune_ACO(jobs, workers, initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values, max_iterations=1000, tolerance=1e-5):
+    :param params: Dictionary with num_ants, initial_pheromone, alpha, beta, evap_coeff, Q, max_iterations, tolerance and patience.
+    :param rng: Seed or numpy Generator of the colony's random draws.
+    :param capacity_aware: Leave out the matches of workers that can never fit the job (see create_matches).
+    :return: Tuple (optimal_path, total_duration).
+    """
+    matches = create_matches(jobs, workers, params['initial_pheromone'], capacity_aware=capacity_aware)
+    ants = [Ant(id=j) for j in range(1, params['num_ants'] + 1)]
+    # Run the ACO algorithm
+    return ACO(jobs, workers, matches, ants, params['alpha'], params['beta'], params['evap_coeff'], params['Q'],
+               max_iterations=params['max_iterations'], tolerance=params['tolerance'], patience=params['patience'], rng=rng)
+
+# Jobs and workers rebuilt once in each pool process
+_restart_problem = None
+
+def problem_initargs(jobs, workers, instance=None):
+    """
+    Arguments of init_restart_worker: the path of the compiled instance if there is one, the
+    jobs and workers as records otherwise (Job objects hold thread locks and cannot be pickled).
+    """
+    if instance:
+        return None, None, instance
+    return create_job_records(jobs), create_worker_records(workers), None
+
+def init_restart_worker(job_records, worker_records, instance=None):
+    global _restart_problem
+    if instance:
+        job_table, worker_table = open_instance(instance)
+        _restart_problem = (create_jobs_from_table(job_table, records=True), create_workers_from_table(worker_table, records=True))
+    else:
+        _restart_problem = (job_records, worker_records)
+    if transfer_aware:
+        configure_worker_duration(capacity_aware, TransferCosts(*_restart_problem))
+
+def run_restart_in_worker(params, rng):
+    """
+    Runs one restart in a pool process and returns its path as (job index, worker index) pairs.
+    """
+    jobs, workers = _restart_problem
+    job_index = {job: j for j, job in enumerate(jobs)}
+    worker_index = {worker: w for w, worker in enumerate(workers)}
+    optimal_path, total_duration = run_restart(jobs, workers, params, rng)
+    return [(job_index[job], worker_index[worker]) for job, worker in optimal_path], total_duration
+
+
+def fine_tune_ACO(jobs, workers, initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values, max_iterations=1000, tolerance=1e-5, rng=None):
     """
     Fine-tunes the ACO algorithm by testing all combinations of the given parameter values.
     
@@ -62,10 +149,12 @@ def fine_tune_ACO(jobs, workers, initial_pheromones, num_ants_list, alpha_values
     :param Q_values: List of Q values to test.
     :param max_iterations: Maximum number of iterations for each ACO run.
     :param tolerance: Convergence tolerance for each ACO run.
+    :param rng: Seed or numpy Generator from which every combination's run gets its own stream.
     :return: Sorted list of results with total duration and corresponding parameters.
     """
     # Initialize a list to store results
     results = []
+    rng = make_rng(rng)
    
     # Calculate the total number of combinations for tqdm
     total_combinations = len(initial_pheromones) * len(num_ants_list) * len(alpha_values) * len(beta_values) * len(evap_coeffs) * len(Q_values)
@@ -74,13 +163,14 @@ def fine_tune_ACO(jobs, workers, initial_pheromones, num_ants_list, alpha_values
     for initial_pheromone, num_ants, alpha, beta, evap_coeff, Q in tqdm(product(initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values), total=total_combinations, desc="Fine-tuning parameters"):
         
         # Create matches for the current initial pheromone level
-        matches = create_matches(jobs, workers, initial_pheromone)
+        matches = create_matches(jobs, workers, initial_pheromone, capacity_aware=capacity_aware)
        
         # Create ants for the current number of ants
         ants = [Ant(id=i) for i in range(1, num_ants + 1)]
         
         # Run the ACO algorithm with the current combination of parameters
-        optimal_path, total_duration = ACO(jobs, matches, ants, alpha, beta, evap_coeff, Q, max_iterations, tolerance, max_iterations/2)
+        optimal_path, total_duration = ACO(jobs, workers, matches, ants, alpha, beta, evap_coeff, Q, max_iterations, tolerance, max_iterations/2,
+                                           rng=spawn_rngs(rng, 1)[0])
        
         # Store the result with parameters for sorting later
         results.append({
@@ -126,72 +216,163 @@ def define_parameter_sets(jobs):
     return initial_pheromones, num_ants_list, alpha_values, beta_values, evap_coeffs, Q_values
 
 
-def random_search_ACO(jobs, workers, param_ranges, num_trials=100,inner_iterations=100):
+def random_search_ACO(jobs, workers, param_ranges, num_trials=100, inner_iterations=10, max_iterations=100, tolerance=1e-5, n_workers=1, store_path=None, rng=None, trial_prefix="trial", instance=None):
     """
     Fine-tunes the ACO algorithm using Random Search.
 
+    Trials can run in a process pool and every finished trial is appended to a JSONL store
+    (parameters, best and mean makespan, wall time). Rerunning with the same store skips the
+    trials it already holds, so an interrupted search resumes where it stopped.
+
     :param jobs: List of job objects.
     :param workers: List of worker objects.
     :param param_ranges: Dictionary containing ranges for parameters.
     :param num_trials: Number of random parameter sets to test.
-    :param max_iterations: Maximum number of iterations for each ACO run.
     :param inner_iterations: Number of iterations for find_optimal_path.
+    :param max_iterations: Maximum number of iterations for each ACO run.
     :param tolerance: Convergence tolerance for each ACO run.
+    :param n_workers: Number of processes running trials in parallel (1 runs them in this process).
+    :param store_path: Path of the JSONL trial store (None keeps results in memory only).
+    :param rng: Seed or numpy Generator of the parameter sampling and of the trials' restarts.
+    :param instance: Path of the compiled instance of the jobs and workers, opened by the pool processes.
+    :param trial_prefix: Prefix of the trial ids in the store, to keep several searches in one file apart.
     :return: Sorted list of results with total duration and corresponding parameters.
     """
-    # Initialize a list to store results
-    results = []
+    # Sample every trial up front so that a resumed search tests the same parameter sets
+    settings = {'inner_iterations': inner_iterations, 'max_iterations': max_iterations, 'tolerance': tolerance, 'patience': 10}
+    context = search_context(jobs, workers, settings)
+    store = TrialStore(store_path) if store_path else None
+    rng = search_seed(rng, store, trial_prefix, context, param_ranges)
+    trials = sample_trials(param_ranges, num_trials, rng, trial_prefix, context=context)
 
-    # Run Random Search for the given number of trials
-    for _ in tqdm(range(num_trials), desc="Random Search Trials"):
-        # Randomly sample parameter values from the given ranges
-        initial_pheromone = uniform(*param_ranges['initial_pheromones'])
-        num_ants = int(choice(range(param_ranges['num_ants_list'][0], param_ranges['num_ants_list'][1]+1)))
-        alpha = uniform(*param_ranges['alpha_values'])
-        beta = uniform(*param_ranges['beta_values'])
-        evap_coeff = uniform(*param_ranges['evap_coeffs'])
-        Q = uniform(*param_ranges['Q_values'])
-
-        # # run ACO with the sampled parameters
-        # # Create matches for the current initial pheromone level
-        # matches = create_matches(jobs, workers, initial_pheromone)
-       
-        # # Create ants for the current number of ants
-        # ants = [Ant(id=i) for i in range(1, num_ants + 1)]
-        
-        # # Run the ACO algorithm with the current combination of parameters
-        # optimal_path, total_duration = ACO(jobs, workers,  matches, ants, alpha, beta, evap_coeff, Q, inner_iterations, patience= 10)
+    # Run Random Search, taking the trials already finished by a previous run from the store
+    results = run_trials(jobs, workers, trials, settings, n_workers, store, desc="Random Search Trials", instance=instance)
 
-        # Use find_optimal_path instead of single ACO run
-        optimal_path, total_duration, mean_duration = find_optimal_path(
-            jobs=jobs,
-            workers=workers,
-            num_ants=num_ants,
-            initial_pheromone=initial_pheromone,
-            alpha=alpha,
-            beta=beta,
-            evap_coeff=evap_coeff,
-            Q=Q,
-        )
+    # Sort results by total duration
+    results.sort(key=lambda x: (x['total_duration']))
 
-        # Store the result with parameters
-        results.append({
-            'total_duration': total_duration,
+    # Print sorted results
+    print_best_results(results)
+
+    return results
+
+def search_context(jobs, workers, settings):
+    """
+    Describes what the trials of a search are scored on: the instance, the search settings and the
+    evaluation mode, so that trials scored under another objective are never reused.
+    """
+    return {'instance': instance_key(jobs, workers), 'settings': settings,
+            'capacity_aware': capacity_aware, 'transfer_aware': transfer_aware}
+
+def search_seed(rng, store, trial_prefix, context, param_ranges):
+    """
+    Returns the seed of a search, so that a search started without one can still be resumed.
+
+    Without rng, the seed stored for the same search (prefix, context and ranges) is reused; the
+    first run draws one from fresh entropy and appends it to the store.
+
+    :param rng: Seed or numpy Generator given to the search (returned as is unless None).
+    :param store: TrialStore of the search, or None (nothing to resume: rng is returned as is).
+    :return: Seed or numpy Generator of the search.
+    """
+    if rng is not None or store is None:
+        return rng
+    search_id = f"{trial_prefix}-seed-{trial_digest(context, param_ranges)}"
+    record = store.load().get(search_id)
+    if record is not None:
+        return record['seed']
+    seed = int(np.random.SeedSequence().entropy)
+    store.append({'trial_id': search_id, 'seed': seed})
+    return seed
+
+def trial_digest(*parts):
+    """
+    Returns a short hash of JSON-serializable values, used to build trial ids.
+    """
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+def sample_trials(param_ranges, num_trials, rng=None, trial_prefix="trial", context=None):
+    """
+    Samples random parameter sets from the given ranges.
+
+    The id of a trial hashes the context (instance, settings and evaluation mode of the search),
+    the ranges, the state of the sampler and the index of the trial, so a store only resumes the
+    trials of the same search. Without a seed the sampler starts from fresh entropy: the searches
+    get theirs from search_seed to stay resumable.
+
+    :param param_ranges: Dictionary containing ranges for parameters.
+    :param num_trials: Number of parameter sets to sample.
+    :param rng: Seed or numpy Generator of the sampling and of the trials' restarts.
+    :param trial_prefix: Prefix of the trial ids.
+    :param context: JSON-serializable description of the search (instance signature, settings).
+    :return: List of trials (dictionaries with trial_id, seed and parameters).
+    """
+    sampler = make_rng(rng)
+    search = trial_digest(context, param_ranges, sampler.bit_generator.state)
+    trial_seeds = restart_seeds(sampler, num_trials)
+    trials = []
+    for i in range(num_trials):
+        trials.append({
+            'trial_id': f"{trial_prefix}-{i}-{trial_digest(search, i)}",
+            'seed': trial_seeds[i],
             'parameters': {
-                'initial_pheromone': initial_pheromone,
-                'num_ants': num_ants,
-                'alpha': alpha,
-                'beta': beta,
-                'evap_coeff': evap_coeff,
-                'Q': Q
+                'initial_pheromone': float(sampler.uniform(*param_ranges['initial_pheromones'])),
+                'num_ants': int(sampler.integers(param_ranges['num_ants_list'][0], param_ranges['num_ants_list'][1]+1)),
+                'alpha': float(sampler.uniform(*param_ranges['alpha_values'])),
+                'beta': float(sampler.uniform(*param_ranges['beta_values'])),
+                'evap_coeff': float(sampler.uniform(*param_ranges['evap_coeffs'])),
+                'Q': float(sampler.uniform(*param_ranges['Q_values']))
             }
         })
+    return trials
 
-    # Sort results by both total duration and mean duration
-    results.sort(key=lambda x: (x['total_duration']))
+def run_trials(jobs, workers, trials, settings, n_workers=1, store=None, desc="Trials", instance=None):
+    """
+    Runs a batch of trials, in a process pool if n_workers > 1, skipping those already in the store.
+
+    :param trials: List of trials (dictionaries with trial_id, seed and parameters).
+    :param settings: Dictionary with inner_iterations, max_iterations, tolerance and patience.
+    :param n_workers: Number of processes running trials in parallel (1 runs them in this process).
+    :param store: TrialStore receiving every finished trial, or None.
+    :param desc: Label of the progress bar.
+    :param instance: Path of the compiled instance of the jobs and workers, opened by the pool processes.
+    :return: List of trial records, in completion order.
+    """
+    done = store.load() if store else {}
+
+    def finished(trial):
+        # A stored record is only reused if it was run with the same parameters
+        record = done.get(trial['trial_id'])
+        return record is not None and record.get('parameters') == trial['parameters']
+
+    results = [done[trial['trial_id']] for trial in trials if finished(trial)]
+    pending = [trial for trial in trials if not finished(trial)]
+
+    def record(result):
+        results.append(result)
+        if store:
+            store.append(result)
+
+    with tqdm(total=len(trials), initial=len(results), desc=desc) as progress:
+        if n_workers > 1 and pending:
+            with ProcessPoolExecutor(max_workers=n_workers,
+                                     initializer=init_restart_worker,
+                                     initargs=problem_initargs(jobs, workers, instance)) as executor:
+                futures = [executor.submit(run_trial_in_worker, trial, settings) for trial in pending]
+                for future in as_completed(futures):
+                    record(future.result())
+                    progress.update()
+        else:
+            for trial in pending:
+                record(run_trial(jobs, workers, trial, settings))
+                progress.update()
+    return results
 
-    # Print sorted results
-    for result in results[:10]:  # Show only the top 10 configurations
+def print_best_results(results, count=10):
+    """
+    Prints the best configurations of a sorted list of results.
+    """
+    for result in results[:count]:  # Show only the top configurations
         params = result['parameters']
         formatted_duration = format_duration(result['total_duration'])
         print(f"Best Duration: {formatted_duration} | "
@@ -199,6 +380,105 @@ def random_search_ACO(jobs, workers, param_ranges, num_trials=100,inner_iteratio
               f"Num Ants: {params['num_ants']}, Alpha: {params['alpha']:.3f}, Beta: {params['beta']:.3f}, "
               f"Evap Coeff: {params['evap_coeff']:.3f}, Q: {params['Q']:.3f}")
 
+def run_trial(jobs, workers, trial, settings):
+    """
+    Evaluates one parameter set with find_optimal_path.
+
+    :param trial: Dictionary with trial_id, seed and parameters.
+    :param settings: Dictionary with inner_iterations, max_iterations, tolerance and patience.
+    :return: The trial record (trial_id, parameters, total_duration, mean_duration, wall_time).
+    """
+    start = time.perf_counter()
+    optimal_path, total_duration, mean_duration = find_optimal_path(
+        jobs=jobs,
+        workers=workers,
+        iterations=settings['inner_iterations'],
+        max_iterations=settings['max_iterations'],
+        tolerance=settings['tolerance'],
+        patience=settings['patience'],
+        rng=trial['seed'],
+        **trial['parameters']
+    )
+    return {
+        'trial_id': trial['trial_id'],
+        'parameters': trial['parameters'],
+        'total_duration': total_duration,
+        'mean_duration': mean_duration,
+        'wall_time': time.perf_counter() - start
+    }
+
+def run_trial_in_worker(trial, settings):
+    jobs, workers = _restart_problem
+    return run_trial(jobs, workers, trial, settings)
+
+def successive_halving_ACO(jobs, workers, param_ranges, num_configs=81, eta=3, min_iterations=50, max_iterations=1000, min_restarts=1, max_restarts=10, min_patience=10, tolerance=1e-5, n_workers=1, store_path=None, rng=None, trial_prefix="halving", instance=None):
+    """
+    Fine-tunes the ACO algorithm with Successive Halving.
+
+    All sampled configurations start on a small budget (max_iterations, patience and number of
+    restarts); after each rung only the best 1/eta of them are promoted to a budget eta times
+    larger, so most of the compute goes to the configurations that are still competitive.
+
+    :param jobs: List of job objects.
+    :param workers: List of worker objects.
+    :param param_ranges: Dictionary containing ranges for parameters.
+    :param num_configs: Number of random parameter sets in the first rung.
+    :param eta: Reduction factor between two rungs.
+    :param min_iterations: Maximum number of iterations of each ACO run in the first rung.
+    :param max_iterations: Cap on the number of iterations of each ACO run.
+    :param min_restarts: Number of find_optimal_path restarts in the first rung.
+    :param max_restarts: Number of find_optimal_path restarts in the last rung.
+    :param min_patience: Patience of each ACO run in the first rung (scaled like the iterations).
+    :param tolerance: Convergence tolerance for each ACO run.
+    :param n_workers: Number of processes running trials in parallel (1 runs them in this process).
+    :param store_path: Path of the JSONL trial store, used to resume an interrupted search.
+    :param rng: Seed or numpy Generator of the parameter sampling and of the trials' restarts.
+    :param instance: Path of the compiled instance of the jobs and workers, opened by the pool processes.
+    :param trial_prefix: Prefix of the trial ids in the store.
+    :return: List of results in the same form as random_search_ACO, the configurations that
+             reached the last rung first, each with the result of its highest budget.
+    """
+    store = TrialStore(store_path) if store_path else None
+    search = {'num_configs': num_configs, 'eta': eta, 'min_iterations': min_iterations, 'max_iterations': max_iterations,
+              'min_restarts': min_restarts, 'max_restarts': max_restarts, 'min_patience': min_patience, 'tolerance': tolerance}
+    context = search_context(jobs, workers, search)
+    rng = search_seed(rng, store, trial_prefix, context, param_ranges)
+    configs = sample_trials(param_ranges, num_configs, rng, trial_prefix, context=context)
+
+    # Number of rungs needed to narrow the configurations down to one
+    num_rungs = 1
+    while num_configs // eta ** num_rungs >= 1:
+        num_rungs += 1
+
+    final_results = {}  # trial_id -> result at the highest budget reached
+    for rung in range(num_rungs):
+        scale = eta ** rung
+        restarts = min_restarts + round((max_restarts - min_restarts) * rung / max(num_rungs - 1, 1))
+        settings = {
+            'inner_iterations': restarts,
+            'max_iterations': min(min_iterations * scale, max_iterations),
+            'tolerance': tolerance,
+            'patience': min_patience * scale
+        }
+        # The id of a rung trial carries its budget and parameters, so a store never resumes it with another budget
+        config_ids = {f"{config['trial_id']}-rung{rung}-{trial_digest(config['parameters'], settings)}": config['trial_id'] for config in configs}
+        trials = [dict(config, trial_id=trial_id) for trial_id, config in zip(config_ids, configs)]
+        results = run_trials(jobs, workers, trials, settings, n_workers, store, desc=f"Successive Halving Rung {rung}", instance=instance)
+
+        for result in results:
+            final_results[config_ids[result['trial_id']]] = dict(result, rung=rung, budget=settings)
+
+        # Promote the best 1/eta configurations to the next rung
+        ranking = sorted(results, key=lambda x: (x['total_duration'], x['mean_duration']))
+        survivors = {config_ids[result['trial_id']] for result in ranking[:max(len(configs) // eta, 1)]}
+        configs = [config for config in configs if config['trial_id'] in survivors]
+
+    # Sort results: configurations that went further first, then by total duration
+    results = sorted(final_results.values(), key=lambda x: (-x['rung'], x['total_duration']))
+
+    # Print sorted results
+    print_best_results(results)
+
     return results
 
 # Define parameter ranges for Random Search
@@ -216,7 +496,7 @@ def define_random_search_ranges(jobs):
     }
     return param_ranges
 
-def deep_random_search_ACO(jobs, workers, param_ranges, num_trials=100, max_iterations=100, inner_iterations=10, tolerance=1e-5, min_interval_width=1e-2, max_depth=10, log_file="deep_random_search_log.txt"):
+def deep_random_search_ACO(jobs, workers, param_ranges, num_trials=100, max_iterations=100, inner_iterations=10, tolerance=1e-5, min_interval_width=1e-2, max_depth=10, log_file="deep_random_search_log.txt", n_workers=1, store_path=None, rng=None, instance=None):
     """
     Performs a Deep Random Search to fine-tune ACO parameters by recursively narrowing the search space.
 
@@ -230,6 +510,10 @@ def deep_random_search_ACO(jobs, workers, param_ranges, num_trials=100, max_iter
     :param min_interval_width: Minimum width of the parameter interval to stop recursion.
     :param max_depth: Maximum recursion depth to prevent infinite loops.
     :param log_file: Path to file where the results will be logged.
+    :param n_workers: Number of processes running the trials of each depth in parallel.
+    :param store_path: Path of the JSONL trial store shared by all depths, used to resume an interrupted search.
+    :param rng: Seed or numpy Generator of the search (each depth spawns its own stream from it).
+    :param instance: Path of the compiled instance of the jobs and workers, opened by the pool processes.
     :return: Best parameters and their corresponding total duration.
     """
     def recursive_random_search(param_ranges, depth=0):
@@ -251,7 +535,12 @@ def deep_random_search_ACO(jobs, workers, param_ranges, num_trials=100, max_iter
             num_trials=num_trials,
             max_iterations=max_iterations,
             inner_iterations=inner_iterations,
-            tolerance=tolerance
+            tolerance=tolerance,
+            n_workers=n_workers,
+            store_path=store_path,
+            rng=spawn_rngs(search_rng, 1)[0],
+            trial_prefix=f"depth{depth}",
+            instance=instance
         )
         
         # Calculate the mean total duration across all trials
@@ -315,6 +604,10 @@ def deep_random_search_ACO(jobs, workers, param_ranges, num_trials=100, max_iter
         # Recursively call the function with the new parameter ranges
         return recursive_random_search(new_param_ranges, depth + 1)
 
-    # Start the recursive search with the initial parameter ranges
+    # Start the recursive search with the initial parameter ranges, from the stored seed if none is given
+    settings = {'num_trials': num_trials, 'max_iterations': max_iterations, 'inner_iterations': inner_iterations,
+                'tolerance': tolerance, 'min_interval_width': min_interval_width, 'max_depth': max_depth}
+    store = TrialStore(store_path) if store_path else None
+    search_rng = make_rng(search_seed(rng, store, "deep", search_context(jobs, workers, settings), param_ranges))
     return recursive_random_search(param_ranges)
 
@@ -1,32 +1,26 @@
+import heapq
+import bisect
+import numpy as np
+from functools import partial
+from utils.options import duration_cache_size, capacity_aware
+from utils.method.cache import WorkerDurationCache
+
 def pheromone_update(ants, matches, evap_coeff, Q):
     """
     Updates the pheromone levels on the matches based on the ants' paths.
 
     :param ants: List of ants, where each ant has a path attribute (a list of job-worker tuples).
-    :param matches: List of Match objects with pheromone levels to be updated.
+    :param matches: MatchTable of Match objects with pheromone levels to be updated.
     :param evap_coeff: Coefficient for pheromone evaporation (ρ).
     :param Q: Constant value for pheromone deposition.
     :return: Updated matches with new pheromone levels.
     """
-    # Evaporate pheromones on all matches
-    for match in matches:
-        match.pheromone *= (1-evap_coeff)  # Apply evaporation to all pheromone values
-
-    # Update pheromones based on each ant's path
-    for ant in ants:
-        l = max_worker_processing_duration(ant.path)  # Max processing duration across workers
+    # Pheromone deposited by the ants on each (job index, worker index) pair
+    deposits = collect_deposits(ants, matches, Q)
 
-        # Count the number of unique workers involved in the path
-        unique_workers = set(worker for _, worker in ant.path)
-        num_workers = len(unique_workers)
-
-        # Calculate pheromone to deposit (Δτ_ij)
-        # pheromone = Q / l # Inversely proportional to path length
-        pheromone = Q / l * num_workers # Proportional to the number of workers and inversely proportional to path length
-
-        for match in matches:
-            if match.value in ant.path:  # Check if the job-worker pair was part of the ant's path
-                match.pheromone += pheromone  # Add pheromone based on the ant's contribution                
+    # Evaporation and deposits in a single pass over all matches
+    for cell, match in matches.cells.items():
+        match.pheromone = match.pheromone * (1-evap_coeff) + deposits.get(cell, 0.0)
 
     return matches
 
@@ -42,7 +36,7 @@ def pheromone_update_minmax(ants,
                             tau_max):
     """
     Mise à jour Min–Max + élitiste des phéromones.
-    - matches : liste d’objets Match
+    - matches : table d’objets Match (MatchTable)
     - ants : listes de fourmis
     - evap_coeff : ρ
     - Q : constante de dépôt
@@ -50,21 +44,16 @@ def pheromone_update_minmax(ants,
     - best_global_length : makespan de cette solution
     - tau_min, tau_max : bornes de clamp
     """
-    # 1) Évaporation + clamp
-    for m in matches:
-        m.pheromone = (1 - evap_coeff) * m.pheromone
-        m.pheromone = min(max(m.pheromone, tau_min), tau_max)
-
-    # 2) Dépôt standard par chaque fourmi
-    for ant in ants:
-        Lk = max_worker_processing_duration(ant.path)
-        num_workers = len({w for _, w in ant.path})
-        delta = Q / Lk * num_workers
+    # 1) Dépôt standard par chaque fourmi, cumulé par paire (job, worker)
+    deposits = collect_deposits(ants, matches, Q)
 
-        for m in matches:
-            if m.value in ant.path:
-                m.pheromone += delta
-                m.pheromone = min(max(m.pheromone, tau_min), tau_max)
+    # 2) Évaporation + clamp, puis dépôt + clamp, en une seule passe
+    #    (les dépôts sont positifs : un seul clamp après leur somme suffit)
+    for cell, m in matches.cells.items():
+        pheromone = min(max((1 - evap_coeff) * m.pheromone, tau_min), tau_max)
+        if cell in deposits:
+            pheromone = min(pheromone + deposits[cell], tau_max)
+        m.pheromone = pheromone
 
     # # 3) Dépôt élitiste sur best_global_path
     # delta_elite = Q / best_global_length
@@ -78,6 +67,65 @@ def pheromone_update_minmax(ants,
 
     return matches
 
+def collect_deposits(ants, matches, Q):
+    """
+    Sums the pheromone deposited by the ants on each job-worker pair of their paths.
+
+    :param ants: List of ants, where each ant has a path attribute (a list of job-worker tuples).
+    :param matches: MatchTable used to resolve the (job index, worker index) of each pair.
+    :param Q: Constant value for pheromone deposition.
+    :return: Dictionary mapping (job index, worker index) to the total deposit (Δτ_ij).
+    """
+    deposits = {}
+    for ant in ants:
+        l = max_worker_processing_duration(ant.path)  # Max processing duration across workers
+        num_workers = len({worker for _, worker in ant.path})
+
+        # Proportional to the number of workers and inversely proportional to path length
+        delta = Q / l * num_workers
+
+        for job, worker in ant.path:
+            cell = (matches.job_index(job), matches.worker_index(worker))
+            deposits[cell] = deposits.get(cell, 0.0) + delta
+    return deposits
+
+def pheromone_update_minmax_vectorized(pheromone,
+                                       assignments,
+                                       lengths,
+                                       evap_coeff,
+                                       Q,
+                                       tau_min,
+                                       tau_max,
+                                       feasible=None):
+    """
+    Array form of pheromone_update_minmax.
+
+    :param pheromone: Array (jobs x workers) of pheromone levels, updated in place.
+    :param assignments: Integer array (ants x jobs) of the workers chosen by each ant.
+    :param lengths: Array of the makespan of each ant's assignment.
+    :param evap_coeff: Coefficient for pheromone evaporation (ρ).
+    :param Q: Constant for pheromone deposition.
+    :param tau_min: Lower pheromone bound.
+    :param tau_max: Upper pheromone bound.
+    :param feasible: Boolean array (jobs x workers) of the pairs with a match; the others are kept at 0.
+    :return: The updated pheromone array.
+    """
+    # 1) Evaporation + clamp
+    pheromone *= (1 - evap_coeff)
+    np.clip(pheromone, tau_min, tau_max, out=pheromone)
+    if feasible is not None:
+        pheromone *= feasible  # The clamp must not raise pairs without match to tau_min
+
+    # 2) Deposit of every ant, proportional to the number of workers it uses
+    num_workers = np.array([len(np.unique(assignment)) for assignment in assignments])
+    deltas = Q / np.asarray(lengths, dtype=float) * num_workers
+    jobs_index = np.broadcast_to(np.arange(assignments.shape[1]), assignments.shape)
+    np.add.at(pheromone, (jobs_index, assignments), deltas[:, np.newaxis])
+
+    # Deposits are positive, so clamping once after all of them equals clamping after each one
+    np.minimum(pheromone, tau_max, out=pheromone)
+    return pheromone
+
 def init_min_max_pheromones(rho, best_length, n_decisions, p_best=0.05):
     """
     Calcule tau_max et tau_min selon Stützle & Hoos.
@@ -85,7 +133,13 @@ def init_min_max_pheromones(rho, best_length, n_decisions, p_best=0.05):
     p_best = probabilité de choisir la meilleure solution
     """
     tau_max = 1.0 / (rho * best_length)
-    tau_min = (tau_max * (1 - p_best**(1/n_decisions))) / ((n_decisions/2 - 1) * p_best**(1/n_decisions))
+    avg = n_decisions/2 - 1
+    if avg <= 0:
+        avg = 1  # Batches of one or two jobs (e.g. an epoch of the online mode)
+    tau_min = (tau_max * (1 - p_best**(1/n_decisions))) / (avg * p_best**(1/n_decisions))
+    if tau_min >= tau_max:
+        # Up to four decisions the bound exceeds tau_max: keep an open range below tau_max
+        tau_min = tau_max / (2 * n_decisions)
     return tau_min, tau_max
 
 def max_worker_processing_duration(path):
@@ -111,7 +165,7 @@ def max_worker_processing_duration(path):
     for worker_info in worker_jobs.values():
         worker = worker_info['worker']  # Get the worker object
         jobs = worker_info['jobs']  # Get the list of jobs
-        worker_duration = calculate_worker_duration(jobs, worker)
+        worker_duration = worker_duration_cache(jobs, worker)
         max_duration = max(max_duration, worker_duration)
 
     return max_duration
@@ -182,70 +236,132 @@ def max_worker_processing_duration(path):
 
 #     return total_time
 
-def calculate_worker_duration(jobs, worker):
+def calculate_worker_duration(jobs, worker, capacity_aware=False, transfer_costs=None):
     """
     Calculates the total duration for a worker considering simultaneous job execution
     based on the worker's available resources (memory, disk, CPU cores).
+
+    Event-driven simulation: running jobs sit in a min-heap keyed on their completion
+    time and resources are released incrementally as each completion event is popped.
+    Pending jobs are started greedily in order of increasing processing duration.
     
     :param jobs: List of jobs assigned to the worker.
     :param worker: The worker object with available resources (memory, disk, cores).
+    :param capacity_aware: Use the worker's real number of cores instead of the historical 20.
+    :param transfer_costs: TransferCosts of the instance. When given, a job cannot start before its
+                           Docker image has been built and sent to the worker, and the worker is only
+                           done once the result files are uploaded back to the master.
     :return: The total time required for the worker to complete all jobs.
     """
     # Sort jobs by their processing duration as a heuristic to allocate resources efficiently
-    jobs = sorted(jobs, key=lambda job: job.standard_processing_durations[worker.name])
+    if transfer_costs is None:
+        pending = sorted(
+            ((job.standard_processing_durations[worker.name],
+              job.required_memory_size_for_execution,
+              job.required_disk_size_for_execution,
+              job.thread_process_count,
+              0) for job in jobs),
+            key=lambda requirements: requirements[0])
+        arrivals = []
+        everything = pending
+    else:
+        # Jobs wait in arrivals (latest release first) until their image is on the worker
+        pending = []
+        arrivals = sorted(
+            ((release,
+              (job.standard_processing_durations[worker.name],
+               job.required_memory_size_for_execution,
+               job.required_disk_size_for_execution,
+               job.thread_process_count,
+               upload)) for job, (release, upload) in zip(jobs, transfer_costs.release_times(jobs, worker))),
+            key=lambda arrival: arrival[0], reverse=True)
+        everything = [requirements for _, requirements in arrivals]
 
-    total_time = 0
     # Initialize available resources for the worker
-    # available_memory = 8.0 * 1024 * 1024 * 1024  # Example: 8 GB in bytes
-    # available_disk = 64.0 * 1024 * 1024 * 1024  # Example: 64 GB in bytes
     available_memory = worker.available_memory_size
     available_disk = worker.available_disk_size
-    available_cores = 20
-
-    # List of jobs that are executing in parallel with their remaining durations
-    executing_jobs = []
-
-    # List to track remaining job processing times
-    remaining_durations = {job: job.standard_processing_durations[worker.name] for job in jobs}
-
-    while jobs or executing_jobs:
-        # Try to allocate more jobs to be executed in parallel
-        remaining_jobs = []
-        for job in jobs:
-            # Check if the worker can handle this job along with the currently executing jobs
-            if (available_memory >= job.required_memory_size_for_execution and
-                available_disk >= job.required_disk_size_for_execution and
-                available_cores >= job.thread_process_count):
-                
-                # If the worker can handle this job, add it to the executing jobs
-                executing_jobs.append(job)
-                available_memory -= job.required_memory_size_for_execution
-                available_disk -= job.required_disk_size_for_execution
-                available_cores -= job.thread_process_count
-            else:
-                # If the worker can't handle it, put it back in the remaining jobs
-                remaining_jobs.append(job)
-
-        # If no jobs are currently executing, we advance time by the duration of the job that finishes next
-        if executing_jobs:
-            # Find the job with the shortest remaining processing time in the current executing jobs
-            min_duration = min(remaining_durations[job] for job in executing_jobs)
-            total_time += min_duration
-
-            # Remove completed jobs and update available resources
-            completed_jobs = []
-            for job in executing_jobs:
-                remaining_durations[job] -= min_duration  # Reduce the remaining duration for this job
-                if remaining_durations[job] == 0:  # Job has finished
-                    available_memory += job.required_memory_size_for_execution
-                    available_disk += job.required_disk_size_for_execution
-                    available_cores += job.thread_process_count
-                    completed_jobs.append(job)
-
-            # Remove completed jobs from the executing list
-            executing_jobs = [job for job in executing_jobs if job not in completed_jobs]
-
-        # Update the jobs list with the remaining jobs for the next iteration
-        jobs = remaining_jobs
-
-    return total_time
\ No newline at end of file
+    available_cores = worker.cpu_info.number_of_cores if capacity_aware else 20
+
+    # Smallest requirements of any job: below them, no pending job can start
+    min_memory = min((requirements[1] for requirements in everything), default=0)
+    min_disk = min((requirements[2] for requirements in everything), default=0)
+    min_cores = min((requirements[3] for requirements in everything), default=0)
+
+    current_time = 0
+    finish_time = 0
+    running = []  # Min-heap of (completion time, sequence number, memory, disk, cores)
+    sequence = 0
+
+    while pending or running or arrivals:
+        # Jobs whose image has arrived join the pending jobs, still in duration order
+        while arrivals and arrivals[-1][0] <= current_time:
+            bisect.insort(pending, arrivals.pop()[1], key=lambda requirements: requirements[0])
+
+        # Start every pending job that fits in the resources left, in duration order
+        if pending and available_memory >= min_memory and available_disk >= min_disk and available_cores >= min_cores:
+            waiting = []
+            for position, requirements in enumerate(pending):
+                duration, memory, disk, cores, upload = requirements
+                if (available_memory >= memory and
+                    available_disk >= disk and
+                    available_cores >= cores):
+                    available_memory -= memory
+                    available_disk -= disk
+                    available_cores -= cores
+                    heapq.heappush(running, (current_time + duration, sequence, memory, disk, cores))
+                    finish_time = max(finish_time, current_time + duration + upload)
+                    sequence += 1
+                    if available_memory < min_memory or available_disk < min_disk or available_cores < min_cores:
+                        waiting.extend(pending[position + 1:])  # The worker is full, stop scanning
+                        break
+                else:
+                    waiting.append(requirements)
+            pending = waiting
+
+        next_release = arrivals[-1][0] if arrivals else float('inf')
+        if not running:
+            if not arrivals:
+                raise ValueError(f"Worker {worker.name} can never fit the remaining {len(pending)} job(s) in its resources.")
+            current_time = next_release  # Idle until the next image arrives
+            continue
+        if next_release < running[0][0]:
+            current_time = next_release  # An image arrives before the next completion and may fit
+            continue
+
+        # Advance time to the next completion and release every job finishing at that time
+        current_time = running[0][0]
+        while running and running[0][0] == current_time:
+            _, _, memory, disk, cores = heapq.heappop(running)
+            available_memory += memory
+            available_disk += disk
+            available_cores += cores
+
+    return finish_time
+
+def committed_worker_duration(jobs, worker, compute, committed_load):
+    """
+    Duration of a worker that must first finish the work already committed to it.
+
+    :param compute: Function (jobs, worker) returning the duration of the jobs alone.
+    :param committed_load: Dictionary worker name -> time left on the jobs committed to the worker.
+    """
+    return committed_load.get(worker.name, 0.0) + compute(jobs, worker)
+
+def configure_worker_duration(capacity_aware=capacity_aware, transfer_costs=None, committed_load=None):
+    """
+    Sets the evaluation mode of worker_duration_cache (resource model and transfer costs) and drops its entries.
+
+    :param capacity_aware: Use the real number of cores of the workers.
+    :param transfer_costs: TransferCosts of the instance being solved, or None to count compute time only.
+    :param committed_load: Dictionary worker name -> time left on the jobs already committed to the worker
+                           (see algorithm/online.py), added to the duration of the worker; None for idle workers.
+    """
+    compute = partial(calculate_worker_duration, capacity_aware=capacity_aware, transfer_costs=transfer_costs)
+    if committed_load:
+        compute = partial(committed_worker_duration, compute=compute, committed_load=committed_load)
+    worker_duration_cache.compute = compute
+    worker_duration_cache.clear()
+
+# Durations of the per-worker job sets, shared by every evaluation of a run
+# (evaluation mode set from the options, see configure_worker_duration)
+worker_duration_cache = WorkerDurationCache(partial(calculate_worker_duration, capacity_aware=capacity_aware), maxsize=duration_cache_size)
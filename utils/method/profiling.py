@@ -0,0 +1,176 @@
+import json
+import os
+from contextlib import nullcontext
+from time import perf_counter
+from utils.method.pheromone_update import worker_duration_cache
+
+class PhaseTimer:
+    def __init__(self, caches=None):
+        """
+        Built-in instrumentation of an ACO run: cumulative wall time of each phase of an iteration,
+        iteration and evaluation throughput, and hit rates of the caches used by the run.
+
+        The same timer can be passed to several runs, its figures then add up.
+
+        :param caches: Dictionary name -> cache with hits/misses counters, by default the worker duration cache.
+        """
+        self.caches = caches if caches is not None else {'worker_duration': worker_duration_cache}
+        self.times = {}
+        self.calls = {}
+        self.phases = {}
+        self.hooks = []
+        self.iterations = 0
+        self.evaluations = 0
+        self.elapsed = 0.0
+        self.started = None
+        self.cache_counts = {name: [0, 0] for name in self.caches}
+        self.cache_baselines = {}
+
+    def add_hook(self, callback, every=1):
+        """
+        Registers a callback run every `every` iterations as callback(iteration, summary).
+        """
+        self.hooks.append((callback, max(1, int(every))))
+
+    def phase(self, name):
+        """
+        Context manager adding the time spent in its block to the phase `name`.
+        """
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = _Phase(self, name)
+            self.times[name] = 0.0
+            self.calls[name] = 0
+        return phase
+
+    def start(self):
+        """
+        Called by the solver before the first iteration.
+        """
+        self.started = perf_counter()
+        self.cache_baselines = {name: (cache.hits, cache.misses) for name, cache in self.caches.items()}
+
+    def iteration(self, iteration, evaluations):
+        """
+        Called by the solver at the end of every iteration.
+
+        :param iteration: Iteration number.
+        :param evaluations: Number of makespans computed during the iteration.
+        """
+        self.iterations += 1
+        self.evaluations += evaluations
+        for callback, every in self.hooks:
+            if self.iterations % every == 0:
+                callback(iteration, self.summary())
+
+    def stop(self):
+        """
+        Called by the solver after the last iteration.
+        """
+        if self.started is None:
+            return
+        self.elapsed += perf_counter() - self.started
+        for name, (hits, misses) in self._cache_deltas().items():
+            self.cache_counts[name][0] += hits
+            self.cache_counts[name][1] += misses
+        self.started = None
+
+    def summary(self):
+        """
+        Returns the figures of the timer as a dictionary (times in seconds).
+        """
+        wall_time = self.elapsed
+        cache_counts = {name: list(counts) for name, counts in self.cache_counts.items()}
+        if self.started is not None:  # Figures of a run in progress
+            wall_time += perf_counter() - self.started
+            for name, (hits, misses) in self._cache_deltas().items():
+                cache_counts[name][0] += hits
+                cache_counts[name][1] += misses
+
+        phases = {}
+        for name, time in self.times.items():
+            phases[name] = {
+                'time': time,
+                'calls': self.calls[name],
+                'calls_per_second': self.calls[name] / time if time else 0.0,
+                'share': time / wall_time if wall_time else 0.0
+            }
+        caches = {}
+        for name, (hits, misses) in cache_counts.items():
+            caches[name] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
+        return {
+            'wall_time': wall_time,
+            'iterations': self.iterations,
+            'iterations_per_second': self.iterations / wall_time if wall_time else 0.0,
+            'evaluations': self.evaluations,
+            'evaluations_per_second': self.evaluations / wall_time if wall_time else 0.0,
+            'phases': phases,
+            'caches': caches
+        }
+
+    def dump(self, path):
+        """
+        Writes the summary to a JSON file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def report(self):
+        """
+        Returns the summary as a readable text table.
+        """
+        summary = self.summary()
+        lines = [f"{summary['iterations']} iterations in {summary['wall_time']:.3f} s "
+                 f"({summary['iterations_per_second']:.1f} it/s, {summary['evaluations_per_second']:.1f} evaluations/s)"]
+        for name, phase in sorted(summary['phases'].items(), key=lambda item: -item[1]['time']):
+            lines.append(f"  {name:<20} {phase['time']:>9.3f} s {100 * phase['share']:>6.1f} % {phase['calls_per_second']:>12.1f} calls/s")
+        for name, cache in summary['caches'].items():
+            lines.append(f"  {name} cache: {100 * cache['hit_rate']:.1f} % hits ({cache['hits']} hits, {cache['misses']} misses)")
+        return "\n".join(lines)
+
+    def _cache_deltas(self):
+        deltas = {}
+        for name, cache in self.caches.items():
+            hits, misses = self.cache_baselines.get(name, (0, 0))
+            # The counters restart from zero when the cache is cleared during the run
+            deltas[name] = (cache.hits - hits if cache.hits >= hits else cache.hits,
+                            cache.misses - misses if cache.misses >= misses else cache.misses)
+        return deltas
+
+
+class _Phase:
+    __slots__ = ('timer', 'name', 'started')
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.timer.times[self.name] += perf_counter() - self.started
+        self.timer.calls[self.name] += 1
+
+
+class NullTimer:
+    """
+    Stand-in used by the solvers when no profiler is given: every call does nothing.
+    """
+    _phase = nullcontext()
+
+    def phase(self, name):
+        return self._phase
+
+    def start(self):
+        pass
+
+    def iteration(self, iteration, evaluations):
+        pass
+
+    def stop(self):
+        pass
@@ -0,0 +1,22 @@
+import numpy as np
+
+def make_rng(rng=None):
+    """
+    Returns a numpy Generator from a seed, a SeedSequence or an existing Generator.
+
+    :param rng: None (fresh entropy), an integer seed, a SeedSequence or a Generator (returned as is).
+    :return: A numpy Generator.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+def spawn_rngs(rng, count):
+    """
+    Spawns statistically independent child streams, one per ant or per restart.
+
+    :param rng: Anything accepted by make_rng.
+    :param count: Number of child streams.
+    :return: List of numpy Generators.
+    """
+    return make_rng(rng).spawn(count)
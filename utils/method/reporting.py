@@ -0,0 +1,95 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# matplotlib (through utils.method.animation) is only imported once something is actually drawn,
+# so the solver modules importing this one stay light in headless runs and pool processes.
+
+def save_learning_curve(makespans, path="output/learning_curve.png"):
+    """
+    Plots the makespan of every iteration and saves it as an image, without pyplot (no window, no GUI backend).
+
+    :param makespans: Recorded makespan of each iteration.
+    :param path: Path of the image file.
+    :return: The path of the image file.
+    """
+    from matplotlib.figure import Figure
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.plot(range(len(makespans)), makespans, marker='o')
+    ax.set_title("Learning Curve of ACO")
+    ax.set_xlabel("Iteration")
+    ax.set_ylabel("Makespan (Total Duration)")
+    ax.grid()
+    fig.savefig(path, dpi=300)
+    return path
+
+
+class Reporter:
+    def __init__(self, animate=False, learning_curve=False, animation_stride=1,
+                 animation_path="output/ACO_animation.gif", learning_curve_path="output/learning_curve.png"):
+        """
+        Optional reporting of an ACO run, kept out of the solver loop.
+
+        The reporter records the makespan of every iteration, streams the animation frames if
+        requested, and writes the learning curve in a background thread once the run is over.
+
+        :param animate: Flag to stream an animation of the pheromone levels.
+        :param learning_curve: Flag to save the learning curve at the end of the run.
+        :param animation_stride: Number of iterations between two frames of the animation.
+        :param animation_path: Path of the animation file.
+        :param learning_curve_path: Path of the learning curve image.
+        """
+        self.animate = animate
+        self.learning_curve = learning_curve
+        self.animation_stride = animation_stride
+        self.animation_path = animation_path
+        self.learning_curve_path = learning_curve_path
+        self.history = []
+        self.animator = None
+        self.executor = None
+        self.futures = []
+
+    def start(self, jobs, workers, matches):
+        """
+        Called by the solver before the first iteration.
+        """
+        self.history = []
+        if self.animate:
+            from utils.method.animation import NetworkAnimator
+            self.animator = NetworkAnimator(jobs, workers, matches, path=self.animation_path, stride=self.animation_stride)
+
+    def record(self, iteration, makespan, pheromone):
+        """
+        Called by the solver after every iteration.
+
+        :param iteration: Iteration number.
+        :param makespan: Makespan of the current best path.
+        :param pheromone: The MatchTable of the run, or the pheromone array of the numpy engine.
+        """
+        self.history.append(makespan)
+        if self.animator:
+            self.animator.update(iteration, pheromone)
+
+    def finish(self):
+        """
+        Called by the solver after the last iteration: closes the animation and starts writing the learning curve.
+        """
+        if self.animator:
+            self.animator.close()
+            self.animator = None
+        if self.learning_curve:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1)
+            self.futures.append(self.executor.submit(save_learning_curve, list(self.history), self.learning_curve_path))
+
+    def wait(self):
+        """
+        Blocks until the pending reports are written and returns their paths.
+        """
+        paths = [future.result() for future in self.futures]
+        self.futures = []
+        return paths
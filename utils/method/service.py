@@ -0,0 +1,167 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from algorithm.anytime import run_anytime
+from models.ant import Ant
+from utils.method.data_treatment import create_matches, create_job_records, create_worker_records, instance_key
+from utils.method.optimization import run_restart
+from utils.method.pheromone_update import configure_worker_duration
+from utils.method.transfer_costs import TransferCosts
+
+# Solver parameters of a request, completed by the ones it gives (see run_restart); with a
+# 'time_budget' in seconds the anytime solver is used and max_iterations/patience are ignored.
+# 'capacity_aware' and 'transfer_aware' set the resource and transfer model of the request
+DEFAULT_PARAMS = {
+    'num_ants': 5,
+    'initial_pheromone': 0.554,
+    'alpha': 1.182,
+    'beta': 0.497,
+    'evap_coeff': 0.892,
+    'Q': 75.021,
+    'max_iterations': 100,
+    'tolerance': 1e-5,
+    'patience': 10,
+    'time_budget': None,
+    'capacity_aware': False,
+    'transfer_aware': False
+}
+
+def solve_in_process(job_records, worker_records, params, seed):
+    """
+    Solves one request in a pool process.
+
+    The evaluation mode of the process-wide worker_duration_cache is set for the request, which
+    is why solves must not share a process (see SchedulingService).
+
+    :return: Tuple (path as (job index, worker index) pairs, makespan).
+    """
+    # Also drops the entries cached for the previous requests, which can never be hit again
+    transfer_costs = TransferCosts(job_records, worker_records) if params['transfer_aware'] else None
+    configure_worker_duration(params['capacity_aware'], transfer_costs)
+    if params['time_budget']:
+        matches = create_matches(job_records, worker_records, params['initial_pheromone'], capacity_aware=params['capacity_aware'])
+        ants = [Ant(id=j) for j in range(1, params['num_ants'] + 1)]
+        best = run_anytime(job_records, worker_records, matches, ants, params['alpha'], params['beta'], params['evap_coeff'],
+                           params['Q'], time_budget=params['time_budget'], tolerance=params['tolerance'], rng=seed)
+        path, makespan = best.best_path, best.makespan
+    else:
+        path, makespan = run_restart(job_records, worker_records, params, seed, capacity_aware=params['capacity_aware'])
+    job_index = {job: j for j, job in enumerate(job_records)}
+    worker_index = {worker: w for w, worker in enumerate(worker_records)}
+    return [(job_index[job], worker_index[worker]) for job, worker in path], makespan
+
+
+class SchedulingService:
+    def __init__(self, n_workers=1, max_in_flight=None, executor=None):
+        """
+        Asyncio front end of the ACO solver.
+
+        The colonies run in a process pool, so awaiting a solve never blocks the event loop.
+        Concurrent requests for the same instance, parameters and seed share a single solve, and
+        at most max_in_flight solves are submitted to the pool at a time (the others wait their turn
+        on a semaphore instead of piling up in the pool queue).
+
+        Each solve sets the evaluation mode of the worker duration cache of its process, which is
+        global, so solves must run in separate processes: thread pools are refused.
+
+        :param n_workers: Number of processes of the pool.
+        :param max_in_flight: Maximum number of solves running at once (defaults to n_workers).
+        :param executor: Process pool to use instead of creating one (it is not shut down by close).
+        :raises ValueError: If executor is a thread pool.
+        """
+        if isinstance(executor, ThreadPoolExecutor):
+            raise ValueError("SchedulingService needs a process pool: concurrent solves in threads would share the worker duration cache.")
+        self.owns_executor = executor is None
+        self.executor = executor if executor is not None else ProcessPoolExecutor(max_workers=n_workers)
+        self.max_in_flight = max_in_flight or n_workers
+        self.semaphore = None
+        self.pending = {}
+        self.requests = 0
+        self.coalesced = 0
+        self.solves = 0
+
+    async def solve(self, jobs, workers, params=None, seed=None):
+        """
+        Solves a job-worker assignment problem.
+
+        :param jobs: List of jobs (Job or JobRecord objects).
+        :param workers: List of workers (Worker or WorkerRecord objects).
+        :param params: Dictionary of solver parameters overriding DEFAULT_PARAMS.
+        :param seed: Seed of the colony, None for fresh entropy.
+        :return: Tuple (optimal path as (job, worker) pairs of the given objects, makespan).
+        """
+        params = {**DEFAULT_PARAMS, **(params or {})}
+        key = (instance_key(jobs, workers), tuple(sorted(params.items())), seed)
+        self.requests += 1
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._solve(jobs, workers, params, seed))
+            self.pending[key] = task
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded: a caller giving up does not cancel the solve shared with the others
+        path, makespan = await asyncio.shield(task)
+        return [(jobs[j], workers[w]) for j, w in path], makespan
+
+    async def _solve(self, jobs, workers, params, seed):
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_in_flight)  # Created in the running loop
+        async with self.semaphore:
+            self.solves += 1
+            loop = asyncio.get_running_loop()
+            call = partial(solve_in_process, create_job_records(jobs), create_worker_records(workers), params, seed)
+            return await loop.run_in_executor(self.executor, call)
+
+    def stats(self):
+        """
+        Returns the request counters of the service as a dictionary.
+        """
+        return {'requests': self.requests, 'coalesced': self.coalesced, 'solves': self.solves, 'in_flight': len(self.pending)}
+
+    def close(self):
+        if self.owns_executor:
+            self.executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # Shut the pool down without blocking the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+class LocalDispatcher:
+    def __init__(self, service):
+        """
+        Local stand-in for the job-dispatch stack: turns scheduling requests into assignments through a SchedulingService.
+
+        :param service: The SchedulingService solving the requests.
+        """
+        self.service = service
+        self.assignments = []
+
+    async def assign(self, jobs, workers, params=None, seed=None):
+        """
+        Handles one scheduling request.
+
+        :return: Tuple (list of (job name, worker name) pairs, makespan).
+        """
+        path, makespan = await self.service.solve(jobs, workers, params, seed)
+        assignment = [(job.name, worker.name) for job, worker in path]
+        self.assignments.append((assignment, makespan))
+        return assignment, makespan
+
+    async def replay(self, requests, interval=0.0):
+        """
+        Sends requests at a fixed rate without waiting for the previous ones, as a dispatcher would.
+
+        :param requests: Iterable of (jobs, workers, params, seed) tuples.
+        :param interval: Delay in seconds between two requests.
+        :return: List of the (assignment, makespan) results, in request order.
+        """
+        tasks = []
+        for jobs, workers, params, seed in requests:
+            tasks.append(asyncio.ensure_future(self.assign(jobs, workers, params, seed)))
+            await asyncio.sleep(interval)
+        return await asyncio.gather(*tasks)
@@ -0,0 +1,50 @@
+import numpy as np
+
+class TransferCosts:
+    def __init__(self, jobs, workers):
+        """
+        Precomputed costs of moving jobs between the master PC and the workers.
+
+        The master builds the Docker images one after the other, in job order, so the time at
+        which each image is ready does not depend on the assignment. Each image is then sent
+        over the link of its worker (one transfer at a time per link, in order of readiness),
+        and the result file is uploaded back once the job is done.
+
+        :param jobs: List of jobs of the instance.
+        :param workers: List of workers of the instance.
+        """
+        self.job_indices = {job: j for j, job in enumerate(jobs)}
+        self.worker_indices = {worker: w for w, worker in enumerate(workers)}
+
+        build_durations = np.array([job.docker_file_generation_duration_on_master_pc for job in jobs], dtype=float)
+        image_sizes = np.array([job.docker_file_size for job in jobs], dtype=float)
+        result_sizes = np.array([job.estimated_result_file_size for job in jobs], dtype=float)
+        bandwidths = np.array([worker.connection_bandwidth_with_master_pc for worker in workers], dtype=float)
+        delays = np.array([worker.connection_delay_with_master_pc for worker in workers], dtype=float)
+
+        # A link without bandwidth figure only costs its delay
+        seconds_per_byte = np.divide(1.0, bandwidths, out=np.zeros_like(bandwidths), where=bandwidths > 0)
+
+        # Kept as nested lists: the simulation reads single values, which is faster than indexing arrays
+        self.image_ready = np.cumsum(build_durations).tolist()
+        self.image_transfer = (delays[np.newaxis, :] + image_sizes[:, np.newaxis] * seconds_per_byte[np.newaxis, :]).tolist()
+        self.result_upload = (delays[np.newaxis, :] + result_sizes[:, np.newaxis] * seconds_per_byte[np.newaxis, :]).tolist()
+
+    def release_times(self, jobs, worker):
+        """
+        Computes when the jobs of a worker can start and how long their results take to come back.
+
+        :param jobs: List of jobs assigned to the worker.
+        :param worker: The worker.
+        :return: List of tuples (release time, upload duration), aligned with jobs.
+        """
+        w = self.worker_indices[worker]
+        indices = [self.job_indices[job] for job in jobs]
+        releases = [0.0] * len(jobs)
+        link_free = 0.0
+        # Images are sent in the order the master finishes building them
+        for position in sorted(range(len(jobs)), key=lambda position: indices[position]):
+            j = indices[position]
+            link_free = max(self.image_ready[j], link_free) + self.image_transfer[j][w]
+            releases[position] = link_free
+        return [(release, self.result_upload[j][w]) for release, j in zip(releases, indices)]
@@ -0,0 +1,51 @@
+import os
+import json
+
+class TrialStore:
+    def __init__(self, path):
+        """
+        Append-only JSONL store of finished tuning trials.
+
+        Every finished trial is written as one line and flushed to disk immediately, so an
+        interrupted search loses at most the trials that were still running.
+
+        :param path: Path of the JSONL file (created on the first append).
+        """
+        self.path = path
+
+    def load(self):
+        """
+        Reads the finished trials.
+
+        :return: Dictionary mapping trial_id to the stored record.
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Line truncated by an interruption
+                records[record['trial_id']] = record
+        return records
+
+    def append(self, record):
+        """
+        Persists one finished trial.
+
+        :param record: JSON-serializable dictionary with at least a 'trial_id' key.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a+") as f:
+            # Start on a fresh line if the previous run was interrupted mid-write
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                if f.read(1) != "\n":
+                    f.write("\n")
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
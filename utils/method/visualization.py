@@ -1,21 +1,36 @@
 import networkx as nx
-from utils.method.pheromone_update import calculate_worker_duration
+from utils.method.pheromone_update import worker_duration_cache
 from utils.method.evaluate import format_duration
 
+def network_layout(jobs, workers):
+    """
+    Names and positions of the nodes of the job-worker graph: jobs on the left, workers on the right.
+
+    :return: A tuple (job node names, worker node names, dictionary of node positions).
+    """
+    # Create nodes for jobs and workers
+    job_nodes = [f"{job.name}_{i}" for i, job in enumerate(jobs)]
+    worker_nodes = [worker.name for worker in workers]
+
+    # Define positions with spacing
+    vertical_offset = 10
+    max_y = (len(job_nodes)*vertical_offset)
+    pos = {}
+    pos.update((job, (0, i * vertical_offset)) for i, job in enumerate(job_nodes))  # Jobs on left
+    pos.update((worker, (1, i + i * max_y/len(workers))) for i, worker in enumerate(worker_nodes))  # Workers on right
+    return job_nodes, worker_nodes, pos
+
 def visualize_network(jobs, workers, matches, ax):
     """
     Visualizes the job-worker bipartite graph with NetworkX, where edge thickness represents pheromone levels.
     
     :param jobs: List of job objects.
     :param workers: List of worker objects.
-    :param matches: List of Match objects with pheromone levels.
+    :param matches: MatchTable of Match objects with pheromone levels.
     :param iteration: The current iteration number (optional, for labeling the plot).
     """
     G = nx.DiGraph()
-    
-    # Create nodes for jobs and workers
-    job_nodes = [f"{job.name}_{i}" for i, job in enumerate(jobs)]
-    worker_nodes = [worker.name for worker in workers]
+    job_nodes, worker_nodes, pos = network_layout(jobs, workers)
     
     # Add job and worker nodes to the graph
     G.add_nodes_from(job_nodes, bipartite=0, color='blue')
@@ -25,7 +40,7 @@ def visualize_network(jobs, workers, matches, ax):
     # edge_labels = {}
     for match in matches:
         job, worker = match.value
-        job_name = f"{job.name}_{jobs.index(job)}"
+        job_name = f"{job.name}_{matches.job_index(job)}"
         pheromone = match.pheromone
         edge_weight = match.processing_duration
         edge_thickness = 150*pheromone  
@@ -35,13 +50,6 @@ def visualize_network(jobs, workers, matches, ax):
         # # Prepare labels for edges: (pheromone, processing duration)
         # edge_labels[(job_name, worker.name)] =f"{pheromone:.2f} ; {edge_weight}"
     
-    # Define positions with spacing
-    vertical_offset = 10
-    max_y = (len(job_nodes)*vertical_offset)
-    pos = {}
-    pos.update((job, (0, i * vertical_offset)) for i, job in enumerate(job_nodes))  # Jobs on left
-    pos.update((worker, (1, i + i * max_y/len(workers))) for i, worker in enumerate(worker_nodes))  # Workers on right
-
     # Adjust edge label positions (move toward the left)
     # edge_label_pos = {
     #     (u, v): (
@@ -78,5 +86,5 @@ def display_duration_per_worker(optimal_path):
 			worker_jobs[worker] = []
 		worker_jobs[worker].append(job) 
 	for worker, assigned_jobs in worker_jobs.items():
-		worker_duration = calculate_worker_duration(assigned_jobs, worker)
+		worker_duration = worker_duration_cache(assigned_jobs, worker)
 		print(f"Worker: {worker.name}, Total Duration: {format_duration(worker_duration)}")
\ No newline at end of file
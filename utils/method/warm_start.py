@@ -0,0 +1,91 @@
+import os
+import json
+from utils.method.evaluate import evaluate
+from utils.method.pheromone_update import init_min_max_pheromones
+
+def export_pheromones(matches):
+    """
+    Exports the pheromone levels learned by a run, keyed by job name (job type) and worker name.
+
+    The levels of each job are divided by the highest level of the job, so the table does not
+    depend on the τ_min/τ_max scale of the run, and jobs of the same type are averaged.
+
+    :param matches: MatchTable of a finished run.
+    :return: Dictionary job name -> {worker name: relative level in [0, 1]}.
+    """
+    sums = {}
+    counts = {}
+    for row in matches.rows:
+        top = max((match.pheromone for match in row), default=0.0)
+        if top <= 0:
+            continue
+        name = row[0].value[0].name
+        levels = sums.setdefault(name, {})
+        for match in row:
+            worker = match.value[1]
+            levels[worker.name] = levels.get(worker.name, 0.0) + match.pheromone / top
+        counts[name] = counts.get(name, 0) + 1
+    return {name: {worker: level / counts[name] for worker, level in levels.items()} for name, levels in sums.items()}
+
+def save_pheromones(table, path):
+    """
+    Writes an exported pheromone table to a JSON file.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(table, f, indent=2)
+
+def load_pheromones(path):
+    """
+    Reads a pheromone table written by save_pheromones, an empty table if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def seed_pheromones(matches, table, tau_min, tau_max):
+    """
+    Sets the pheromone levels of the matches from an exported table, scaled to τ_max and clamped to [τ_min, τ_max].
+
+    Jobs whose type is not in the table keep their level; a worker unknown to the table gets τ_max,
+    so that it is still explored.
+
+    :param matches: MatchTable of the next run.
+    :param table: Table returned by export_pheromones or load_pheromones.
+    :return: Number of matches seeded.
+    """
+    seeded = 0
+    for row in matches.rows:
+        if not row:
+            continue
+        levels = table.get(row[0].value[0].name)
+        if levels is None:
+            continue
+        for match in row:
+            level = levels.get(match.value[1].name, 1.0) * tau_max
+            match.pheromone = min(max(level, tau_min), tau_max)
+            seeded += 1
+    return seeded
+
+def warm_start(jobs, matches, table, evap_coeff):
+    """
+    Seeds the matches of a run of the Min–Max solvers with the bounds that run will start from.
+
+    The bounds follow from the makespan of the assignment favoured by the table, as computed by
+    ACO_elitist_minmax at its start (init_min_max_pheromones).
+
+    :param jobs: List of jobs of the run.
+    :param matches: MatchTable of the run.
+    :param table: Table returned by export_pheromones or load_pheromones.
+    :param evap_coeff: Coefficient for pheromone evaporation (ρ) of the run.
+    :return: Tuple (tau_min, tau_max), or None if no job type of the run is in the table.
+    """
+    if not seed_pheromones(matches, table, 0.0, 1.0):  # Relative levels: enough to find the favoured assignment
+        return None
+    _, makespan = evaluate(jobs, matches)
+    tau_min, tau_max = init_min_max_pheromones(evap_coeff, makespan, n_decisions=len(jobs))
+    seed_pheromones(matches, table, tau_min, tau_max)
+    return tau_min, tau_max
@@ -4,4 +4,21 @@ all_jobs = False
 fine_tune = False
 jobs = 27
 animate = False
-learning_curve = True
\ No newline at end of file
+learning_curve = True
+engine = "python"  # "python" (Match objects) or "numpy" (dense arrays)
+duration_cache_size = 100000
+local_search = False
+n_workers = 1
+trial_store = "output/random_search_trials.jsonl"
+tuner = "random"  # "random" (random search) or "halving" (successive halving)
+seed = None  # Integer seed for reproducible runs, None for fresh entropy
+derive_durations = False  # Estimate durations missing from the jobs file with the "Processing Time Ratio To PCx" columns of workers.csv
+instance_cache = "output/instances"  # Directory of the compiled (binary) problem instances, None to parse the CSV files on every run
+solver_records = True  # Solve on the lightweight JobRecord/WorkerRecord (models/records.py) instead of Job/Worker objects
+capacity_aware = False  # Simulate each worker with its real cores, memory and disk, and never assign a job to a worker that cannot handle it
+transfer_aware = False  # Add the Docker builds on the master, the image transfers and the result uploads to the makespan
+animation_stride = 10  # With animate, one frame every animation_stride iterations
+profile_path = None  # JSON file receiving the per-phase timing report of the main ACO run (e.g. "output/profile.json"), None to disable
+time_budget = None  # Wall-clock budget in seconds of the main run (anytime solver, algorithm/anytime.py), None to stop on iterations/patience
+pheromone_store = None  # JSON file of pheromone levels learned per job type and worker (e.g. "output/pheromones.json"): seeds the main run and is updated after it, None to start from uniform levels
+replay_schedule = False  # Replay the assignment of the main run on the discrete-event simulator (utils/method/cluster_simulator.py) and print its timelines and utilization